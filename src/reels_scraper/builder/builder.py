@@ -1,18 +1,199 @@
 """Knowledge base builder and organizer."""
 
-import json
+import codecs
+import logging
+import os
 import re
 import shutil
 import zipfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Match, Optional, Pattern, Set, Tuple
 
 from ..logger import get_logger
+from ..serialization import dumps_json, loads_json
 
 logger = get_logger(__name__)
 
+# Extracted metadata cache kept in the output directory for incremental builds
+_METADATA_CACHE_FILE = ".metadata-cache.json"
+
+# Bumped whenever the cached metadata layout or extraction rules change
+_METADATA_CACHE_VERSION = 1
+
+# Write buffer for index.md; coalesces the many small per-reel writes
+_INDEX_WRITE_BUFFER = 64 * 1024
+
+# Metadata fields as (name, literal anchor, pattern, parser). Fields with a
+# literal anchor are located with str.find and the pattern is only matched at
+# that offset; the rest fall back to a regex search over the content.
+_METADATA_FIELDS: Tuple[Tuple[str, Optional[str], Pattern[str], Callable[[str], Any]], ...] = (
+    ("title", None, re.compile(r"^#\s+(.+)$", re.MULTILINE), str.strip),
+    ("profile", "**Profile**:", re.compile(r"\*\*Profile\*\*:\s*@(\w+)"), str.strip),
+    (
+        "url",
+        "**URL**:",
+        re.compile(r"\*\*URL\*\*:\s*\[[^\]]+\]\(([^)]+)\)"),
+        str.strip,
+    ),
+    (
+        "topics",
+        None,
+        re.compile(r"##\s+Topics\s*\n\s*((?:#\w+\s*)+)", re.IGNORECASE),
+        # The section pattern only admits "#", word characters and whitespace,
+        # so the tags are simply the words left once "#" is blanked out
+        lambda text: text.replace("#", " ").lower().split(),
+    ),
+    ("word_count", "**Word Count**:", re.compile(r"\*\*Word Count\*\*:\s*(\d+)"), int),
+    ("language", "**Language**:", re.compile(r"\*\*Language\*\*:\s*(\w+)"), str.strip),
+)
+
+_REQUIRED_FIELDS = frozenset({"title", "word_count"})
+
+# Section holding the topic tags; may sit in the unread middle of a large report
+_TOPICS_HEADING = re.compile(r"##\s+Topics\b", re.IGNORECASE)
+
+# Report templates put title/profile/URL at the top and topics/language/word
+# count in the footer, so large files are only read at both ends
+_METADATA_HEAD_BYTES = 8 * 1024
+_METADATA_TAIL_BYTES = 8 * 1024
+
+
+def _read_metadata_text(md_file: Path) -> Tuple[str, bool]:
+    """Read the parts of a markdown report that carry metadata.
+
+    Args:
+        md_file: Path to markdown file
+
+    Returns:
+        Tuple of (text, truncated) where truncated is True if only the head and
+        tail of the file were read
+    """
+    with open(md_file, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= _METADATA_HEAD_BYTES + _METADATA_TAIL_BYTES:
+            return f.read().decode("utf-8"), False
+
+        head = f.read(_METADATA_HEAD_BYTES)
+        f.seek(-_METADATA_TAIL_BYTES, os.SEEK_END)
+        tail = f.read()
+
+    # Cuts may split a multi-byte character: the incremental decoder holds back an
+    # incomplete sequence at the end of the head, and continuation bytes at the
+    # start of the tail are skipped. Anything else is decoded as strictly as a
+    # small file.
+    start = 0
+    while start < 3 and tail[start] & 0xC0 == 0x80:
+        start += 1
+    head_text = codecs.getincrementaldecoder("utf-8")().decode(head)
+    return head_text + "\n" + tail[start:].decode("utf-8"), True
+
+
+def _match_at_literal(content: str, literal: str, pattern: Pattern[str]) -> Optional[Match[str]]:
+    """Find the first match of a pattern that starts with a literal prefix.
+
+    Args:
+        content: Text to search
+        literal: Literal prefix the pattern starts with
+        pattern: Compiled pattern, matched only at offsets where literal occurs
+
+    Returns:
+        First match, or None
+    """
+    idx = content.find(literal)
+    while idx >= 0:
+        match = pattern.match(content, idx)
+        if match:
+            return match
+        idx = content.find(literal, idx + len(literal))
+    return None
+
+
+def _scan_metadata(content: str, metadata: Dict) -> Set[str]:
+    """Extract metadata fields from markdown content.
+
+    Args:
+        content: Markdown text
+        metadata: Metadata dictionary to update in place
+
+    Returns:
+        Set of field names that were found
+    """
+    found: Set[str] = set()
+    for field, literal, pattern, parse in _METADATA_FIELDS:
+        if literal is None:
+            match = pattern.search(content)
+        else:
+            match = _match_at_literal(content, literal, pattern)
+
+        if match:
+            metadata[field] = parse(match.group(1))
+            found.add(field)
+
+    return found
+
+
+def _format_index_entry(
+    heading: str, title: str, link: str, metadata: Dict, include_topics: bool = False
+) -> str:
+    """Format one reel entry for index.md as a single block.
+
+    Args:
+        heading: Markdown heading marker (e.g. "###")
+        title: Display title
+        link: Relative link to the markdown file
+        metadata: Extracted file metadata
+        include_topics: Whether to list the reel's topics
+
+    Returns:
+        Entry text, terminated by a blank line
+    """
+    entry = f"{heading} [{title}]({link})\n"
+    if metadata["profile"]:
+        entry += f"**Profile**: @{metadata['profile']}  \n"
+    if metadata["url"]:
+        entry += f"**URL**: {metadata['url']}  \n"
+    entry += f"**Word Count**: {metadata['word_count']}  \n"
+    if include_topics and metadata["topics"]:
+        topics_str = ", ".join(f"#{t}" for t in metadata["topics"])
+        entry += f"**Topics**: {topics_str}  \n"
+    return entry + "\n"
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, falling back to a copy (e.g. across filesystems).
+
+    Where linking works, knowledge base files share their data with the source
+    reports, so editing a knowledge base file in place also changes the
+    original report (and vice versa).
+
+    Args:
+        src: Source file
+        dst: Destination file (replaced if it already exists)
+    """
+    # Nothing to do when dst already is src, e.g. a flat build into the source
+    # directory or a rebuild over an earlier hardlink
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+
+    # Link or copy next to dst, then swap it in, so a failure never leaves dst missing
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            # Timestamps/permissions of knowledge base copies are irrelevant, so
+            # skip copy2's extra copystat syscalls
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
 
 class KnowledgeBaseBuilder:
     """Build and organize knowledge base from markdown files."""
@@ -23,6 +204,7 @@ class KnowledgeBaseBuilder:
         output_dir: Path,
         organize_by_topic: bool = True,
         create_index: bool = True,
+        max_workers: Optional[int] = None,
     ):
         """Initialize knowledge base builder.
 
@@ -31,17 +213,25 @@ class KnowledgeBaseBuilder:
             output_dir: Output directory for organized knowledge base
             organize_by_topic: Whether to organize files by topics
             create_index: Whether to create master index.md
+            max_workers: Number of threads for metadata extraction
+                (default: min(32, 4 * CPU count))
         """
         self.markdown_dir = Path(markdown_dir)
         self.output_dir = Path(output_dir)
         self.organize_by_topic = organize_by_topic
         self.create_index = create_index
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
 
         # Data structures for organization
         self.markdown_files: List[Path] = []
         self.topics_map: Dict[str, List[Path]] = defaultdict(list)
         self.metadata_map: Dict[Path, Dict] = {}
 
+        # Aggregates collected while scanning, reused by index and stats
+        self._total_words = 0
+        self._languages: Set[str] = set()
+        self._profiles: Set[str] = set()
+
         logger.info(f"Knowledge base builder initialized")
         logger.info(f"Source: {self.markdown_dir}")
         logger.info(f"Output: {self.output_dir}")
@@ -53,11 +243,10 @@ class KnowledgeBaseBuilder:
             md_file: Path to markdown file
 
         Returns:
-            Dictionary with metadata (title, profile, topics, etc.)
+            Dictionary with metadata (title, profile, topics, etc.). Files that
+            cannot be read get every field with defaults plus an "error" entry.
         """
         try:
-            content = md_file.read_text(encoding="utf-8")
-
             metadata = {
                 "file": md_file.name,
                 "path": md_file,
@@ -69,40 +258,15 @@ class KnowledgeBaseBuilder:
                 "language": "",
             }
 
-            # Extract title (first # heading)
-            title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-            if title_match:
-                metadata["title"] = title_match.group(1).strip()
-
-            # Extract profile
-            profile_match = re.search(r"\*\*Profile\*\*:\s*@(\w+)", content)
-            if profile_match:
-                metadata["profile"] = profile_match.group(1).strip()
+            content, truncated = _read_metadata_text(md_file)
+            found = _scan_metadata(content, metadata)
 
-            # Extract URL
-            url_match = re.search(r"\*\*URL\*\*:\s*\[([^\]]+)\]\(([^)]+)\)", content)
-            if url_match:
-                metadata["url"] = url_match.group(2).strip()
-
-            # Extract topics (looking for ## Topics section)
-            topics_section = re.search(
-                r"##\s+Topics\s*\n\s*((?:#\w+\s*)+)", content, re.IGNORECASE
-            )
-            if topics_section:
-                topics_text = topics_section.group(1)
-                # Extract hashtags
-                topics = re.findall(r"#(\w+)", topics_text)
-                metadata["topics"] = [t.lower() for t in topics]
-
-            # Extract word count
-            wc_match = re.search(r"\*\*Word Count\*\*:\s*(\d+)", content)
-            if wc_match:
-                metadata["word_count"] = int(wc_match.group(1))
-
-            # Extract language
-            lang_match = re.search(r"\*\*Language\*\*:\s*(\w+)", content)
-            if lang_match:
-                metadata["language"] = lang_match.group(1).strip()
+            # Every generated report has a title, word count and topics section; if
+            # the excerpt missed any of them, rescan the whole file
+            if truncated and (
+                not _REQUIRED_FIELDS <= found or not _TOPICS_HEADING.search(content)
+            ):
+                _scan_metadata(md_file.read_text(encoding="utf-8"), metadata)
 
             return metadata
 
@@ -112,9 +276,70 @@ class KnowledgeBaseBuilder:
                 "file": md_file.name,
                 "path": md_file,
                 "title": md_file.stem,
+                "profile": "",
+                "url": "",
                 "topics": [],
+                "word_count": 0,
+                "language": "",
+                "error": str(e),
             }
 
+    def _load_metadata_cache(self) -> Dict[str, Dict]:
+        """Load metadata cached by a previous build of this knowledge base.
+
+        Returns:
+            Dictionary mapping file name to {"signature", "metadata"} entries
+        """
+        cache_file = self.output_dir / _METADATA_CACHE_FILE
+        try:
+            data = loads_json(cache_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable metadata cache {cache_file}: {e}")
+            return {}
+
+        # A cache from another format version or source directory is useless
+        if data.get("version") != _METADATA_CACHE_VERSION:
+            return {}
+        if data.get("source") != str(self.markdown_dir.resolve()):
+            return {}
+        files: Dict[str, Dict] = data.get("files", {})
+        return files
+
+    def _save_metadata_cache(self, signatures: Dict[str, List[int]], results: List[Dict]) -> None:
+        """Persist extracted metadata for incremental rebuilds.
+
+        Args:
+            signatures: File name to [mtime_ns, size] mapping
+            results: Metadata for each file in self.markdown_files
+        """
+        files = {}
+        for md_file, metadata in zip(self.markdown_files, results):
+            # Fallback entries from failed extractions are retried next build
+            if "error" in metadata:
+                continue
+            files[md_file.name] = {
+                "signature": signatures[md_file.name],
+                "metadata": {k: v for k, v in metadata.items() if k != "path"},
+            }
+
+        cache_file = self.output_dir / _METADATA_CACHE_FILE
+        tmp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+        data = {
+            "version": _METADATA_CACHE_VERSION,
+            "source": str(self.markdown_dir.resolve()),
+            "files": files,
+        }
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so an interrupted build never leaves a truncated cache
+            tmp_file.write_bytes(dumps_json(data, indent=False))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            tmp_file.unlink(missing_ok=True)
+            logger.warning(f"Failed to save metadata cache {cache_file}: {e}")
+
     def scan_markdown_files(self) -> None:
         """Scan markdown directory and extract metadata."""
         logger.info(f"Scanning markdown files in {self.markdown_dir}")
@@ -122,8 +347,13 @@ class KnowledgeBaseBuilder:
         if not self.markdown_dir.exists():
             raise FileNotFoundError(f"Markdown directory not found: {self.markdown_dir}")
 
-        # Find all markdown files
-        self.markdown_files = sorted(self.markdown_dir.glob("*.md"))
+        # Find all markdown files (scandir entries carry the file type, avoiding a stat per file)
+        with os.scandir(self.markdown_dir) as entries:
+            md_entries = sorted(
+                (entry for entry in entries if entry.name.endswith(".md") and entry.is_file()),
+                key=lambda entry: entry.name,
+            )
+        self.markdown_files = [Path(entry.path) for entry in md_entries]
 
         if not self.markdown_files:
             logger.warning(f"No markdown files found in {self.markdown_dir}")
@@ -131,18 +361,61 @@ class KnowledgeBaseBuilder:
 
         logger.info(f"Found {len(self.markdown_files)} markdown files")
 
-        # Extract metadata from each file
-        for md_file in self.markdown_files:
-            metadata = self._extract_metadata_from_markdown(md_file)
-            self.metadata_map[md_file] = metadata
-
-            # Build topics map
-            if metadata["topics"]:
-                for topic in metadata["topics"]:
-                    self.topics_map[topic].append(md_file)
+        # Reuse cached metadata for files unchanged since the last build
+        cache = self._load_metadata_cache()
+        signatures = {}
+        results: List[Dict] = []
+        stale: List[int] = []
+        for md_entry, md_file in zip(md_entries, self.markdown_files):
+            stat = md_entry.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+            signatures[md_file.name] = signature
+
+            cached = cache.get(md_file.name)
+            if cached and cached["signature"] == signature:
+                results.append({**cached["metadata"], "path": md_file})
             else:
-                # Files without topics go to "uncategorized"
-                self.topics_map["uncategorized"].append(md_file)
+                # Placeholder, filled in by the extraction below
+                results.append({})
+                stale.append(len(results) - 1)
+
+        if stale:
+            logger.info(
+                f"Extracting metadata from {len(stale)} new or changed files "
+                f"({len(results) - len(stale)} cached)"
+            )
+
+            # Extract metadata concurrently (file reads dominate), then aggregate serially
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                extracted = executor.map(
+                    self._extract_metadata_from_markdown,
+                    [self.markdown_files[i] for i in stale],
+                )
+                for i, metadata in zip(stale, extracted):
+                    results[i] = metadata
+
+        # Rewrite the cache only if it no longer matches the source directory
+        if stale or cache.keys() != signatures.keys():
+            self._save_metadata_cache(signatures, results)
+
+        self.metadata_map.update(zip(self.markdown_files, results))
+
+        # Accumulate stats and collect (topic, file) pairs in one pass;
+        # files without topics go to "uncategorized"
+        self._total_words = 0
+        self._languages = set()
+        self._profiles = set()
+        pairs: List[Tuple[str, Path]] = []
+        for md_file, metadata in zip(self.markdown_files, results):
+            self._total_words += metadata["word_count"]
+            if metadata["language"]:
+                self._languages.add(metadata["language"])
+            if metadata["profile"]:
+                self._profiles.add(metadata["profile"])
+            pairs.extend((topic, md_file) for topic in metadata["topics"] or ("uncategorized",))
+
+        for topic, md_file in pairs:
+            self.topics_map[topic].append(md_file)
 
         logger.info(f"Extracted metadata from {len(self.metadata_map)} files")
         logger.info(f"Found {len(self.topics_map)} unique topics")
@@ -164,8 +437,8 @@ class KnowledgeBaseBuilder:
 
             for md_file in files:
                 dest_file = topic_dir / md_file.name
-                shutil.copy2(md_file, dest_file)
-                logger.debug(f"Copied {md_file.name} to {topic}/")
+                _link_or_copy(md_file, dest_file)
+                logger.debug("Copied %s to %s/", md_file.name, topic)
 
         logger.info(f"Organized {len(self.markdown_files)} files into {len(self.topics_map)} topics")
 
@@ -181,11 +454,25 @@ class KnowledgeBaseBuilder:
 
         for md_file in self.markdown_files:
             dest_file = self.output_dir / md_file.name
-            shutil.copy2(md_file, dest_file)
-            logger.debug(f"Copied {md_file.name}")
+            _link_or_copy(md_file, dest_file)
+            logger.debug("Copied %s", md_file.name)
 
         logger.info(f"Copied {len(self.markdown_files)} files")
 
+    def _sorted_by_title(self, files: List[Path]) -> List[Tuple[Path, Dict]]:
+        """Pair files with their metadata, sorted by title.
+
+        Args:
+            files: Markdown files to sort
+
+        Returns:
+            List of (file, metadata) tuples ordered by extracted title
+        """
+        # Decorate once so the sort key and the loop body skip repeated dict lookups
+        decorated = [(self.metadata_map[f]["title"], f, self.metadata_map[f]) for f in files]
+        decorated.sort(key=itemgetter(0))
+        return [(md_file, metadata) for _, md_file, metadata in decorated]
+
     def generate_index(self) -> None:
         """Generate master index.md file."""
         if not self.create_index:
@@ -196,79 +483,59 @@ class KnowledgeBaseBuilder:
 
         index_path = self.output_dir / "index.md"
 
-        # Build index content
-        lines = []
-        lines.append("# Instagram Reels Knowledge Base\n")
-        lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        lines.append(f"**Total Reels**: {len(self.markdown_files)}\n")
-        lines.append(f"**Topics**: {len(self.topics_map)}\n")
-        lines.append("\n---\n\n")
-
-        # Statistics
-        total_words = sum(m["word_count"] for m in self.metadata_map.values())
-        languages = set(m["language"] for m in self.metadata_map.values() if m["language"])
-        profiles = set(m["profile"] for m in self.metadata_map.values() if m["profile"])
-
-        lines.append("## Statistics\n\n")
-        lines.append(f"- **Total Word Count**: {total_words:,}\n")
-        lines.append(f"- **Languages**: {', '.join(languages) if languages else 'N/A'}\n")
-        lines.append(f"- **Profiles**: {', '.join('@' + p for p in profiles)}\n")
-        lines.append("\n---\n\n")
-
-        # Topics overview
-        if self.organize_by_topic and self.topics_map:
-            lines.append("## Topics\n\n")
-            for topic in sorted(self.topics_map.keys()):
-                count = len(self.topics_map[topic])
-                lines.append(f"- **{topic}** ({count} reels)\n")
-            lines.append("\n---\n\n")
-
-        # List all reels by topic
-        if self.organize_by_topic:
-            lines.append("## Reels by Topic\n\n")
-            for topic in sorted(self.topics_map.keys()):
-                lines.append(f"### {topic.title()}\n\n")
-
-                files = self.topics_map[topic]
-                for md_file in sorted(files, key=lambda f: self.metadata_map[f]["title"]):
-                    metadata = self.metadata_map[md_file]
-                    title = metadata["title"] or md_file.stem
-                    profile = f"@{metadata['profile']}" if metadata["profile"] else ""
-                    url = metadata["url"]
-                    rel_path = f"{topic}/{md_file.name}"
-
-                    lines.append(f"#### [{title}]({rel_path})\n")
-                    if profile:
-                        lines.append(f"**Profile**: {profile}  \n")
-                    if url:
-                        lines.append(f"**URL**: {url}  \n")
-                    lines.append(f"**Word Count**: {metadata['word_count']}  \n")
-                    lines.append("\n")
-
-                lines.append("\n")
-        else:
-            # Flat structure - just list all files
-            lines.append("## All Reels\n\n")
-            for md_file in sorted(self.markdown_files, key=lambda f: self.metadata_map[f]["title"]):
-                metadata = self.metadata_map[md_file]
-                title = metadata["title"] or md_file.stem
-                profile = f"@{metadata['profile']}" if metadata["profile"] else ""
-                url = metadata["url"]
-
-                lines.append(f"### [{title}]({md_file.name})\n")
-                if profile:
-                    lines.append(f"**Profile**: {profile}  \n")
-                if url:
-                    lines.append(f"**URL**: {url}  \n")
-                lines.append(f"**Word Count**: {metadata['word_count']}  \n")
-                if metadata["topics"]:
-                    topics_str = ", ".join(f"#{t}" for t in metadata["topics"])
-                    lines.append(f"**Topics**: {topics_str}  \n")
-                lines.append("\n")
-
-        # Write index file
-        index_content = "".join(lines)
-        index_path.write_text(index_content, encoding="utf-8")
+        # Stream index content straight to disk through a large write buffer
+        with index_path.open("w", encoding="utf-8", buffering=_INDEX_WRITE_BUFFER) as fh:
+            fh.write("# Instagram Reels Knowledge Base\n")
+            fh.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            fh.write(f"**Total Reels**: {len(self.markdown_files)}\n")
+            fh.write(f"**Topics**: {len(self.topics_map)}\n")
+            fh.write("\n---\n\n")
+
+            fh.write("## Statistics\n\n")
+            fh.write(f"- **Total Word Count**: {self._total_words:,}\n")
+            languages = ", ".join(self._languages) if self._languages else "N/A"
+            fh.write(f"- **Languages**: {languages}\n")
+            fh.write(f"- **Profiles**: {', '.join('@' + p for p in self._profiles)}\n")
+            fh.write("\n---\n\n")
+
+            # Topics overview
+            if self.organize_by_topic and self.topics_map:
+                fh.write("## Topics\n\n")
+                for topic in sorted(self.topics_map.keys()):
+                    count = len(self.topics_map[topic])
+                    fh.write(f"- **{topic}** ({count} reels)\n")
+                fh.write("\n---\n\n")
+
+            # List all reels by topic
+            if self.organize_by_topic:
+                fh.write("## Reels by Topic\n\n")
+                for topic in sorted(self.topics_map.keys()):
+                    fh.write(f"### {topic.title()}\n\n")
+
+                    for md_file, metadata in self._sorted_by_title(self.topics_map[topic]):
+                        fh.write(
+                            _format_index_entry(
+                                "####",
+                                metadata["title"] or md_file.stem,
+                                f"{topic}/{md_file.name}",
+                                metadata,
+                            )
+                        )
+
+                    fh.write("\n")
+            else:
+                # Flat structure - just list all files
+                fh.write("## All Reels\n\n")
+                for md_file, metadata in self._sorted_by_title(self.markdown_files):
+                    fh.write(
+                        _format_index_entry(
+                            "###",
+                            metadata["title"] or md_file.stem,
+                            md_file.name,
+                            metadata,
+                            include_topics=True,
+                        )
+                    )
 
         logger.info(f"Generated index.md at {index_path}")
         logger.info(f"Index contains {len(self.markdown_files)} reels across {len(self.topics_map)} topics")
@@ -308,9 +575,9 @@ class KnowledgeBaseBuilder:
         stats = {
             "total_reels": len(self.markdown_files),
             "total_topics": len(self.topics_map),
-            "total_words": sum(m["word_count"] for m in self.metadata_map.values()),
-            "languages": list(set(m["language"] for m in self.metadata_map.values() if m["language"])),
-            "profiles": list(set(m["profile"] for m in self.metadata_map.values() if m["profile"])),
+            "total_words": self._total_words,
+            "languages": list(self._languages),
+            "profiles": list(self._profiles),
             "topics_breakdown": {topic: len(files) for topic, files in self.topics_map.items()},
             "generated_at": datetime.now().isoformat(),
         }
@@ -322,16 +589,23 @@ class KnowledgeBaseBuilder:
         stats_file = self.output_dir / "stats.json"
         stats = self.create_stats_summary()
 
-        with open(stats_file, "w", encoding="utf-8") as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+        stats_file.write_bytes(dumps_json(stats))
 
         logger.info(f"Saved statistics to {stats_file}")
 
-    def create_zip_archive(self, zip_name: str = "knowledge-base.zip") -> Path:
+    def create_zip_archive(
+        self,
+        zip_name: str = "knowledge-base.zip",
+        compression: int = zipfile.ZIP_DEFLATED,
+        compresslevel: Optional[int] = 1,
+    ) -> Path:
         """Create ZIP archive of the knowledge base.
 
         Args:
             zip_name: Name of the ZIP file
+            compression: ZIP compression method (e.g. zipfile.ZIP_STORED to disable)
+            compresslevel: Compression level; 1 keeps nearly the full ratio on
+                markdown at a fraction of the default level's CPU cost
 
         Returns:
             Path to created ZIP file
@@ -345,14 +619,25 @@ class KnowledgeBaseBuilder:
         zip_path = self.output_dir.parent / zip_name
 
         # Create ZIP archive
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through output directory and add all files
-            for file_path in self.output_dir.rglob("*"):
-                if file_path.is_file():
-                    # Calculate relative path for archive
-                    arcname = file_path.relative_to(self.output_dir.parent)
-                    zipf.write(file_path, arcname)
-                    logger.debug(f"Added to ZIP: {arcname}")
+        with zipfile.ZipFile(
+            zip_path, "w", compression, compresslevel=compresslevel
+        ) as zipf:
+            # Walk through output directory and add all files; arcnames are
+            # "<output_dir name>/<path below output_dir>"
+            base_dir = str(self.output_dir)
+            base_len = len(base_dir) + 1
+            arc_root = self.output_dir.name
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            for root, _dirs, filenames in os.walk(base_dir):
+                arc_dir = os.path.join(arc_root, root[base_len:])
+                for filename in filenames:
+                    if filename == _METADATA_CACHE_FILE and root == base_dir:
+                        continue
+                    arcname = os.path.join(arc_dir, filename)
+                    zipf.write(os.path.join(root, filename), arcname)
+                    if debug:
+                        logger.debug("Added to ZIP: %s", arcname)
 
         # Get ZIP file size
         zip_size = zip_path.stat().st_size
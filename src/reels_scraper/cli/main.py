@@ -149,7 +149,7 @@ def scrape(
     default=None,
     help="Output directory for downloads",
 )
-@click.option("--workers", "-w", type=int, default=3, help="Number of concurrent workers")
+@click.option("--workers", "-w", type=int, default=16, help="Number of concurrent workers")
 @click.option("--skip-existing/--no-skip", default=True, help="Skip already downloaded videos")
 @click.pass_context
 def download(
@@ -191,6 +191,8 @@ def download(
             retry_delay=config.download.retry_delay,
             output_dir=output_dir,
             skip_existing=skip_existing,
+            autotune=config.download.autotune,
+            negative_cache_ttl=config.download.negative_cache_days * 24 * 3600,
         )
 
         # Download videos
@@ -405,6 +407,8 @@ def generate(
             max_summary_length=config.processing.max_summary_length,
             extract_topics=config.processing.extract_topics,
             generate_summary=config.processing.generate_summary,
+            max_workers=config.processing.max_workers,
+            rate_limit_qps=config.processing.rate_limit_qps,
         )
 
         # Process transcripts
@@ -558,7 +562,7 @@ def index(
     help="Output directory",
 )
 @click.option("--limit", "-l", type=int, default=None, help="Maximum number of Reels to process")
-@click.option("--workers", "-w", type=int, default=3, help="Number of concurrent download workers")
+@click.option("--workers", "-w", type=int, default=16, help="Number of concurrent download workers")
 @click.option(
     "--skip-existing", is_flag=True, default=True, help="Skip already downloaded/processed files"
 )
@@ -656,6 +660,8 @@ def full(
             retry_delay=config.download.retry_delay,
             output_dir=download_dir,
             skip_existing=skip_existing,
+            autotune=config.download.autotune,
+            negative_cache_ttl=config.download.negative_cache_days * 24 * 3600,
         )
 
         download_report = downloader.download_batch(reels, show_progress=True)
@@ -711,6 +717,8 @@ def full(
             max_summary_length=config.processing.max_summary_length,
             extract_topics=config.processing.extract_topics,
             generate_summary=config.processing.generate_summary,
+            max_workers=config.processing.max_workers,
+            rate_limit_qps=config.processing.rate_limit_qps,
         )
 
         reports = processor.process_batch(
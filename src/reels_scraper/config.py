@@ -2,12 +2,33 @@
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Final, Optional, Tuple
 
 import yaml
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Default paths, built once and shared by every config instance
+_DEFAULT_DOWNLOAD_DIR: Final[Path] = Path("./output/downloads")
+_DEFAULT_TRANSCRIPT_DIR: Final[Path] = Path("./output/transcripts")
+_DEFAULT_MARKDOWN_DIR: Final[Path] = Path("./output/markdown")
+_DEFAULT_KNOWLEDGE_BASE_DIR: Final[Path] = Path("./output/knowledge-base")
+_DEFAULT_LOG_FILE: Final[Path] = Path("./output/reels_scraper.log")
+_DEFAULT_CONFIG_PATHS: Final[Tuple[Path, ...]] = (Path("config.yaml"), Path("config.yml"))
+
+
+def _as_path(v: str | Path) -> Path:
+    """Coerce a validator input to Path, passing Path instances through untouched."""
+    if isinstance(v, Path):
+        return v
+    return Path(v)
+
 
 class InstagramConfig(BaseSettings):
     """Instagram-specific configuration."""
@@ -25,19 +46,26 @@ class InstagramConfig(BaseSettings):
 class DownloadConfig(BaseSettings):
     """Download-specific configuration."""
 
-    max_workers: int = Field(default=3, ge=1, le=10, description="Number of concurrent workers")
+    max_workers: int = Field(default=16, ge=1, le=64, description="Number of concurrent workers")
     retry_count: int = Field(default=3, ge=0, le=10, description="Number of retry attempts")
     retry_delay: float = Field(default=5.0, ge=0.1, description="Initial retry delay in seconds")
-    output_dir: Path = Field(default=Path("./output/downloads"), description="Download directory")
+    output_dir: Path = Field(default=_DEFAULT_DOWNLOAD_DIR, description="Download directory")
     skip_existing: bool = Field(default=True, description="Skip already downloaded videos")
     video_quality: str = Field(default="best", description="Video quality preference")
+    autotune: bool = Field(
+        default=False, description="Calibrate worker count from measured throughput"
+    )
+    negative_cache_days: float = Field(
+        default=7.0,
+        ge=0,
+        description="Days to skip reels that failed permanently (0 disables the cache)",
+    )
 
     @field_validator("output_dir", mode="before")
     @classmethod
     def validate_output_dir(cls, v: str | Path) -> Path:
         """Convert string to Path and create directory if needed."""
-        path = Path(v) if isinstance(v, str) else v
-        return path
+        return _as_path(v)
 
     model_config = SettingsConfigDict(env_prefix="DOWNLOAD_")
 
@@ -51,7 +79,7 @@ class TranscriptionConfig(BaseSettings):
     model: str = Field(default="whisper-1", description="Model to use for transcription")
     language: str = Field(default="auto", description="Language code or 'auto' for detection")
     output_dir: Path = Field(
-        default=Path("./output/transcripts"), description="Transcript directory"
+        default=_DEFAULT_TRANSCRIPT_DIR, description="Transcript directory"
     )
     include_timestamps: bool = Field(default=True, description="Include timestamps in transcripts")
     max_workers: int = Field(
@@ -70,7 +98,7 @@ class TranscriptionConfig(BaseSettings):
     @classmethod
     def validate_output_dir(cls, v: str | Path) -> Path:
         """Convert string to Path."""
-        return Path(v) if isinstance(v, str) else v
+        return _as_path(v)
 
     model_config = SettingsConfigDict(env_prefix="TRANSCRIPTION_")
 
@@ -83,12 +111,18 @@ class ProcessingConfig(BaseSettings):
         default="gemini-2.0-flash-exp", description="AI model for summarization"
     )
     template: str = Field(default="default", description="Template name to use")
-    output_dir: Path = Field(default=Path("./output/markdown"), description="Markdown directory")
+    output_dir: Path = Field(default=_DEFAULT_MARKDOWN_DIR, description="Markdown directory")
     extract_topics: bool = Field(default=True, description="Extract topics from content")
     generate_summary: bool = Field(default=True, description="Generate AI summary")
     max_summary_length: int = Field(
         default=500, ge=50, le=2000, description="Maximum summary length in words"
     )
+    max_workers: int = Field(
+        default=4, ge=1, le=16, description="Number of concurrent processing workers"
+    )
+    rate_limit_qps: float = Field(
+        default=2.0, ge=0, description="Maximum AI requests per second (0 for unlimited)"
+    )
 
     @field_validator("ai_service")
     @classmethod
@@ -102,7 +136,7 @@ class ProcessingConfig(BaseSettings):
     @classmethod
     def validate_output_dir(cls, v: str | Path) -> Path:
         """Convert string to Path."""
-        return Path(v) if isinstance(v, str) else v
+        return _as_path(v)
 
     model_config = SettingsConfigDict(env_prefix="PROCESSING_")
 
@@ -111,7 +145,7 @@ class KnowledgeBaseConfig(BaseSettings):
     """Knowledge base configuration."""
 
     base_dir: Path = Field(
-        default=Path("./output/knowledge-base"), description="Knowledge base directory"
+        default=_DEFAULT_KNOWLEDGE_BASE_DIR, description="Knowledge base directory"
     )
     create_index: bool = Field(default=True, description="Create master index.md")
     organize_by_topic: bool = Field(default=True, description="Organize files by topics")
@@ -122,7 +156,7 @@ class KnowledgeBaseConfig(BaseSettings):
     @classmethod
     def validate_base_dir(cls, v: str | Path) -> Path:
         """Convert string to Path."""
-        return Path(v) if isinstance(v, str) else v
+        return _as_path(v)
 
     model_config = SettingsConfigDict(env_prefix="KNOWLEDGE_BASE_")
 
@@ -132,7 +166,7 @@ class GeneralConfig(BaseSettings):
 
     log_level: str = Field(default="INFO", description="Logging level")
     log_file: Optional[Path] = Field(
-        default=Path("./output/reels_scraper.log"), description="Log file path"
+        default=_DEFAULT_LOG_FILE, description="Log file path"
     )
     progress_bars: bool = Field(default=True, description="Show progress bars")
     verbose: bool = Field(default=False, description="Verbose output")
@@ -154,7 +188,7 @@ class GeneralConfig(BaseSettings):
         """Convert string to Path."""
         if v is None:
             return None
-        return Path(v) if isinstance(v, str) else v
+        return _as_path(v)
 
     model_config = SettingsConfigDict(env_prefix="GENERAL_")
 
@@ -184,6 +218,10 @@ class Config(BaseSettings):
     def load_from_yaml(cls, yaml_path: Path | str) -> "Config":
         """Load configuration from YAML file and merge with environment variables.
 
+        Parsed YAML is cached per resolved path along with the file's mtime and
+        size, so reloading an unchanged file skips parsing. Environment
+        variables are applied on every load.
+
         Args:
             yaml_path: Path to YAML configuration file
 
@@ -195,14 +233,23 @@ class Config(BaseSettings):
             ValueError: If YAML is invalid
         """
         yaml_path = Path(yaml_path)
-        if not yaml_path.exists():
+        try:
+            stat = yaml_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {yaml_path}")
 
-        try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML configuration: {e}")
+        cache_key = str(yaml_path.resolve())
+        cached = _yaml_data_cache.get(cache_key)
+        # Coarse mtimes can miss a quick rewrite, so a size change also invalidates
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            yaml_data = cached[2]
+        else:
+            try:
+                with open(yaml_path, "r", encoding="utf-8") as f:
+                    yaml_data = yaml.load(f, Loader=_YamlLoader) or {}
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML configuration: {e}")
+            _yaml_data_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, yaml_data)
 
         # Create nested config objects
         config_data = {}
@@ -238,8 +285,7 @@ class Config(BaseSettings):
             return cls.load_from_yaml(config_path)
 
         # Try to find config.yaml in current directory
-        default_paths = [Path("config.yaml"), Path("config.yml")]
-        for path in default_paths:
+        for path in _DEFAULT_CONFIG_PATHS:
             if path.exists():
                 return cls.load_from_yaml(path)
 
@@ -286,6 +332,10 @@ class Config(BaseSettings):
 # Global config instance (initialized lazily)
 _config: Optional[Config] = None
 
+# Parsed YAML documents keyed by resolved path, as (mtime_ns, size, data); one entry
+# per file, replaced when it changes. The data is only read, never mutated.
+_yaml_data_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
 
 def get_config(config_path: Optional[Path | str] = None, reload: bool = False) -> Config:
     """Get or create global configuration instance.
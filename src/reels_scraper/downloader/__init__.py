@@ -1,5 +1,5 @@
 """Video downloader module."""
 
-from .downloader import VideoDownloader, load_reels_from_json
+from .downloader import VideoDownloader, iter_reels_from_json, load_reels_from_json
 
-__all__ = ["VideoDownloader", "load_reels_from_json"]
+__all__ = ["VideoDownloader", "iter_reels_from_json", "load_reels_from_json"]
@@ -1,34 +1,149 @@
 """Video downloader for Instagram Reels."""
 
-import json
+import asyncio
+import os
+import random
+import re
+import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import yt_dlp
 from tqdm import tqdm
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is an optional speedup
+    ijson = None  # type: ignore[assignment]
+
 from ..logger import get_logger
 from ..models import DownloadReport, DownloadStatus, ReelMetadata
-from ..progress import ProgressTracker
+from ..progress import ProgressTracker, ProgressWriter
+from ..serialization import dumps_json, loads_json
 
 logger = get_logger(__name__)
 
+# Upper bound for a single retry backoff, in seconds
+_MAX_RETRY_DELAY = 60.0
+
+# Download errors that will not go away on retry: the server reports the reel as gone,
+# or the extractor says it was removed. Format, geo and impersonation errors can
+# succeed later with other options, so they must not match.
+_PERMANENT_ERROR_PATTERN = re.compile(
+    r"HTTP Error (?:404|410)\b|\bThis (?:video|post|content) has been removed\b",
+    re.IGNORECASE,
+)
+
+# Default time a permanently failed reel is skipped before it is tried again, in seconds
+_NEGATIVE_CACHE_TTL = 7 * 24 * 3600.0
+
+# Outcome of one download task: the reel and its status, or the exception it raised
+_DownloadResult = Tuple[ReelMetadata, Union[DownloadStatus, Exception]]
+
+
+class _ProgressRelay:
+    """Forward progress from worker threads to a tqdm bar redrawn by one thread.
+
+    Workers only append to a deque and store the latest postfix, so reporting
+    completion never contends on tqdm's internal lock.
+    """
+
+    def __init__(self, progress_bar: tqdm, refresh_interval: float = 0.2):
+        """Initialize and start the refresh thread.
+
+        Args:
+            progress_bar: Bar to redraw
+            refresh_interval: Seconds between redraws
+        """
+        self.progress_bar = progress_bar
+        self.refresh_interval = refresh_interval
+        self._increments: Deque[int] = deque()
+        self._postfix: Optional[str] = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress-relay", daemon=True)
+        self._thread.start()
+
+    def update(self, n: int = 1) -> None:
+        """Record completed items."""
+        self._increments.append(n)
+
+    def set_postfix_str(self, s: str) -> None:
+        """Record the latest status text."""
+        self._postfix = s
+
+    def close(self) -> None:
+        """Stop the refresh thread after a final redraw."""
+        self._stopped.set()
+        self._thread.join()
+
+    def _redraw(self) -> None:
+        """Apply pending updates to the bar and refresh it."""
+        completed = 0
+        while self._increments:
+            completed += self._increments.popleft()
+        self.progress_bar.n += completed
+        if self._postfix is not None:
+            self.progress_bar.set_postfix_str(self._postfix, refresh=False)
+        self.progress_bar.refresh()
+
+    def _run(self) -> None:
+        """Redraw the bar every refresh interval until closed."""
+        while not self._stopped.wait(self.refresh_interval):
+            self._redraw()
+        self._redraw()
+
 
 class VideoDownloader:
     """Download Instagram Reels videos concurrently."""
 
+    # Static yt-dlp options, built once at import time
+    _BASE_YDL_OPTS: Mapping[str, Any] = MappingProxyType(
+        {
+            "format": "best",
+            "quiet": True,
+            "no_warnings": True,
+            "extract_flat": False,
+            # Instagram-specific options
+            "http_headers": {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Connection": "keep-alive",
+            },
+            # Keep connections alive across videos and fetch fragments in parallel
+            "socket_timeout": 30,
+            "http_chunk_size": 10 * 1024 * 1024,
+            "concurrent_fragment_downloads": 4,
+        }
+    )
+
     def __init__(
         self,
-        max_workers: int = 3,
+        max_workers: int = 16,
         retry_count: int = 3,
         retry_delay: float = 5.0,
         output_dir: Path = Path("./output/downloads"),
         skip_existing: bool = True,
         enable_resume: bool = True,
         progress_file: Optional[Path] = None,
+        autotune: bool = False,
+        negative_cache_ttl: float = _NEGATIVE_CACHE_TTL,
     ):
         """Initialize video downloader.
 
@@ -40,6 +155,10 @@ class VideoDownloader:
             skip_existing: Skip already downloaded videos
             enable_resume: Enable resume capability with progress tracking
             progress_file: Custom path for progress file (default: output_dir/.download_progress.json)
+            autotune: Calibrate the worker count against measured throughput before
+                the first batch (the result is stored next to the progress file)
+            negative_cache_ttl: Seconds to skip reels that failed permanently before
+                trying them again (0 disables the negative cache)
         """
         self.max_workers = max_workers
         self.retry_count = retry_count
@@ -48,6 +167,27 @@ class VideoDownloader:
         self.skip_existing = skip_existing
         self.enable_resume = enable_resume
         self.progress_file = progress_file or (output_dir / ".download_progress.json")
+        self.autotune = autotune
+        self.tuning_file = self.progress_file.with_name(".download_tuning.json")
+        self.negative_cache_file = self.progress_file.with_name(".download_negative_cache.json")
+        self.negative_cache_ttl = negative_cache_ttl
+
+        # Reels known to be permanently unavailable (404/410 or removed), mapped to
+        # the time they failed
+        self._negative_cache: Dict[str, float] = self._load_negative_cache()
+        self._negative_cache_dirty = False
+
+        # yt-dlp options shared by every download; outtmpl is set per video
+        self._ydl_opts = {
+            **self._BASE_YDL_OPTS,
+            "http_headers": dict(self._BASE_YDL_OPTS["http_headers"]),
+        }
+
+        # One YoutubeDL per worker thread (instances are not thread-safe), reused
+        # across videos so extractor setup and the HTTP session are amortized
+        self._thread_local = threading.local()
+        self._ydl_instances: List[yt_dlp.YoutubeDL] = []
+        self._ydl_lock = threading.Lock()
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -57,6 +197,32 @@ class VideoDownloader:
             f"output: {output_dir}, retry: {retry_count}, resume: {enable_resume}"
         )
 
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get the calling thread's YoutubeDL instance, creating it on first use.
+
+        Returns:
+            YoutubeDL instance owned by the current thread
+        """
+        ydl = getattr(self._thread_local, "ydl", None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(dict(self._ydl_opts))
+            self._thread_local.ydl = ydl
+            with self._ydl_lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+
+    def close(self) -> None:
+        """Close all cached YoutubeDL instances."""
+        with self._ydl_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+            self._thread_local = threading.local()
+
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception as e:
+                logger.debug(f"Failed to close YoutubeDL instance: {e}")
+
     def _get_video_path(self, reel: ReelMetadata) -> Path:
         """Get output path for video file.
 
@@ -69,57 +235,288 @@ class VideoDownloader:
         filename = f"{reel.video_id}_{reel.shortcode}.mp4"
         return self.output_dir / filename
 
-    def _is_video_downloaded(self, reel: ReelMetadata) -> bool:
+    def _is_video_downloaded(
+        self, reel: ReelMetadata, video_path: Optional[Path] = None
+    ) -> Optional[os.stat_result]:
         """Check if video is already downloaded.
 
+        Args:
+            reel: Reel metadata
+            video_path: Precomputed output path (derived from the reel if omitted)
+
+        Returns:
+            Stat result of the video file if it exists, otherwise None (downloads
+            are installed atomically, so an existing file is always complete)
+        """
+        try:
+            return os.stat(video_path or self._get_video_path(reel))
+        except FileNotFoundError:
+            return None
+
+    def _resolve(self, reel: ReelMetadata) -> Optional[Dict[str, Any]]:
+        """Run yt-dlp's extractor for a reel without downloading the media.
+
         Args:
             reel: Reel metadata
 
         Returns:
-            True if video exists and is valid
+            Unprocessed info dict, or None if the reel should be resolved again
+            as part of a regular download
         """
-        video_path = self._get_video_path(reel)
+        if self._is_negatively_cached(reel.video_id):
+            return None
+
+        try:
+            info: Dict[str, Any] = self._get_ydl().extract_info(
+                reel.url, download=False, process=False
+            )
+            return info
+        except Exception as e:
+            logger.debug(f"Failed to resolve {reel.shortcode} ahead of download: {e}")
+            return None
 
-        if not video_path.exists():
-            return False
+    def _fetch(
+        self, url: str, video_path: Path, info: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Download a URL to a file with this thread's reusable YoutubeDL.
 
-        # Check if file size is reasonable (> 1KB)
-        if video_path.stat().st_size < 1024:
-            logger.warning(f"Found incomplete download: {video_path}")
-            return False
+        The video is written to a ``.part`` sibling and renamed into place once
+        complete, so ``video_path`` never holds a partial download.
+
+        Args:
+            url: Reel URL
+            video_path: Destination file
+            info: Info dict from :meth:`_resolve`; skips the extractor step if given
+
+        Returns:
+            Size of the downloaded file in bytes
+
+        Raises:
+            FileNotFoundError: If yt-dlp finished without producing the file
+        """
+        # Sibling of the final path, so installing it is a same-filesystem rename
+        # rather than a cross-device copy
+        part_path = video_path.with_name(video_path.name + ".part")
+
+        ydl = self._get_ydl()
+        ydl.params["outtmpl"]["default"] = str(part_path)
+        if info is not None:
+            ydl.process_ie_result(info, download=True)
+        else:
+            ydl.download([url])
+
+        try:
+            file_size = os.stat(part_path).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Downloaded file not found: {part_path}")
+
+        os.replace(part_path, video_path)
+        self._drop_page_cache(video_path, file_size)
+        return file_size
+
+    @staticmethod
+    def _drop_page_cache(video_path: Path, file_size: int) -> None:
+        """Hint the kernel to evict a freshly downloaded video from the page cache.
+
+        Videos are read once by later stages, so keeping them cached only pushes
+        out hotter pages. No-op on platforms without ``posix_fadvise``.
+
+        Args:
+            video_path: Downloaded video file
+            file_size: Size of the file in bytes
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        try:
+            fd = os.open(video_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, file_size, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.debug(f"posix_fadvise failed for {video_path}: {e}")
+
+    def _autotune_workers(self, sample_reel: ReelMetadata) -> int:
+        """Pick a worker count by measuring aggregate throughput.
+
+        Downloads the sample reel with 1, 2, 4, ... concurrent workers (up to
+        ``max_workers``) and stops at the knee, i.e. the first step that improves
+        throughput by less than 10%. The choice is stored in ``tuning_file`` and
+        reused by later runs.
+
+        Args:
+            sample_reel: Reel used for the calibration downloads
+
+        Returns:
+            Calibrated number of workers
+        """
+        if self.tuning_file.exists():
+            try:
+                workers = int(loads_json(self.tuning_file.read_bytes())["max_workers"])
+                logger.info(f"Using calibrated worker count from {self.tuning_file}: {workers}")
+                return workers
+            except Exception as e:
+                logger.warning(f"Ignoring invalid tuning file {self.tuning_file}: {e}")
+
+        candidates = [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= self.max_workers]
+        best_workers, best_rate = candidates[0], 0.0
+
+        with tempfile.TemporaryDirectory(dir=self.output_dir) as tmp_dir:
+            for n in candidates:
+                paths = [Path(tmp_dir) / f"probe_{n}_{i}.mp4" for i in range(n)]
+                start_time = time.time()
+                try:
+                    with ThreadPoolExecutor(max_workers=n) as executor:
+                        total_bytes = sum(
+                            executor.map(lambda path: self._fetch(sample_reel.url, path), paths)
+                        )
+                except Exception as e:
+                    logger.warning(f"Autotune probe with {n} workers failed: {e}")
+                    break
+                rate = total_bytes / max(time.time() - start_time, 1e-6) / 1024 / 1024
+                logger.debug(f"Autotune: {n} workers -> {rate:.2f} MB/s")
+
+                if rate < best_rate * 1.1:
+                    break
+                best_workers, best_rate = n, rate
+
+        try:
+            self.tuning_file.write_bytes(
+                dumps_json({"max_workers": best_workers, "throughput_mb_s": best_rate})
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save tuning file {self.tuning_file}: {e}")
+
+        logger.info(f"Autotuned download workers: {best_workers} ({best_rate:.2f} MB/s)")
+        return best_workers
+
+    def _load_negative_cache(self) -> Dict[str, float]:
+        """Load reels that failed permanently within the negative cache TTL.
+
+        Returns:
+            Dictionary mapping video id to the time it failed
+        """
+        if self.negative_cache_ttl <= 0 or not self.negative_cache_file.exists():
+            return {}
+
+        try:
+            entries = loads_json(self.negative_cache_file.read_bytes())["video_ids"]
+        except Exception as e:
+            logger.warning(f"Ignoring invalid negative cache {self.negative_cache_file}: {e}")
+            return {}
 
-        return True
+        # Caches written before entries carried a timestamp hold a plain list of ids;
+        # those are retried since their age is unknown
+        if not isinstance(entries, dict):
+            return {}
+
+        cutoff = time.time() - self.negative_cache_ttl
+        return {
+            video_id: float(failed_at)
+            for video_id, failed_at in entries.items()
+            if float(failed_at) >= cutoff
+        }
+
+    def _is_negatively_cached(self, video_id: str) -> bool:
+        """Check whether a reel failed permanently within the negative cache TTL.
+
+        Args:
+            video_id: Video id of the reel
+
+        Returns:
+            True if the reel should be skipped
+        """
+        failed_at = self._negative_cache.get(video_id)
+        return failed_at is not None and time.time() - failed_at < self.negative_cache_ttl
+
+    def _save_negative_cache(self) -> None:
+        """Persist the negative cache if entries were added."""
+        if not self._negative_cache_dirty:
+            return
+
+        try:
+            self.negative_cache_file.write_bytes(
+                dumps_json({"video_ids": dict(sorted(self._negative_cache.items()))})
+            )
+            self._negative_cache_dirty = False
+            logger.debug(f"Saved negative cache to {self.negative_cache_file}")
+        except Exception as e:
+            logger.warning(f"Failed to save negative cache {self.negative_cache_file}: {e}")
+
+    def _scan_existing_videos(self) -> Dict[str, int]:
+        """Collect the sizes of video files already in the output directory.
+
+        Returns:
+            Mapping of file name to size in bytes
+        """
+        try:
+            with os.scandir(self.output_dir) as entries:
+                return {
+                    entry.name: entry.stat().st_size
+                    for entry in entries
+                    if entry.name.endswith(".mp4") and entry.is_file(follow_symlinks=False)
+                }
+        except FileNotFoundError:
+            return {}
 
     def download_single(
-        self, reel: ReelMetadata, progress_bar: Optional[tqdm] = None
+        self,
+        reel: ReelMetadata,
+        progress_bar: Optional[Union[tqdm, "_ProgressRelay"]] = None,
+        video_path: Optional[Path] = None,
+        info: Optional[Dict[str, Any]] = None,
     ) -> DownloadStatus:
         """Download a single video with retry logic.
 
         Args:
             reel: Reel metadata
             progress_bar: Optional progress bar to update
+            video_path: Precomputed output path (derived from the reel if omitted)
+            info: Pre-resolved info dict used for the first attempt; retries
+                resolve the reel again
 
         Returns:
             DownloadStatus instance
         """
-        video_path = self._get_video_path(reel)
+        video_path = video_path or self._get_video_path(reel)
         start_time = time.time()
 
         # Check if already downloaded
-        if self.skip_existing and self._is_video_downloaded(reel):
+        existing = self._is_video_downloaded(reel, video_path) if self.skip_existing else None
+        if existing is not None:
             logger.debug(f"Skipping already downloaded video: {reel.shortcode}")
             if progress_bar:
                 progress_bar.set_postfix_str(f"Skipped: {reel.shortcode}")
-            return DownloadStatus(
+            return DownloadStatus.model_construct(
                 video_id=reel.video_id,
                 success=True,
                 file_path=video_path,
-                file_size=video_path.stat().st_size,
+                file_size=existing.st_size,
                 download_time=0.0,
                 error_message="Already downloaded (skipped)",
                 retry_count=0,
             )
 
+        # Don't spend network round-trips on reels known to be gone
+        if self._is_negatively_cached(reel.video_id):
+            logger.debug(f"Skipping permanently unavailable video: {reel.shortcode}")
+            if progress_bar:
+                progress_bar.set_postfix_str(f"✗ {reel.shortcode}")
+                progress_bar.update(1)
+            return DownloadStatus.model_construct(
+                video_id=reel.video_id,
+                success=False,
+                file_path=None,
+                file_size=0,
+                download_time=0.0,
+                error_message=(
+                    f"Previously failed permanently (remove {self.negative_cache_file.name} "
+                    "or set download.negative_cache_days to 0 to retry)"
+                ),
+                retry_count=0,
+            )
+
         # Try downloading with retries
         for attempt in range(self.retry_count + 1):
             try:
@@ -128,28 +525,7 @@ class VideoDownloader:
                         f"Downloading: {reel.shortcode} (attempt {attempt + 1})"
                     )
 
-                # Configure yt-dlp options
-                ydl_opts = {
-                    "format": "best",
-                    "outtmpl": str(video_path),
-                    "quiet": True,
-                    "no_warnings": True,
-                    "extract_flat": False,
-                    # Instagram-specific options
-                    "http_headers": {
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    },
-                }
-
-                # Download video
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([reel.url])
-
-                # Verify download
-                if not video_path.exists():
-                    raise FileNotFoundError(f"Downloaded file not found: {video_path}")
-
-                file_size = video_path.stat().st_size
+                file_size = self._fetch(reel.url, video_path, info if attempt == 0 else None)
                 download_time = time.time() - start_time
 
                 logger.info(
@@ -161,7 +537,7 @@ class VideoDownloader:
                     progress_bar.set_postfix_str(f"✓ {reel.shortcode}")
                     progress_bar.update(1)
 
-                return DownloadStatus(
+                return DownloadStatus.model_construct(
                     video_id=reel.video_id,
                     success=True,
                     file_path=video_path,
@@ -178,19 +554,28 @@ class VideoDownloader:
                     f"for {reel.shortcode}: {error_msg}"
                 )
 
-                # If not the last attempt, wait before retry (exponential backoff)
+                # If not the last attempt, wait before retry (exponential backoff with
+                # jitter so throttled workers don't retry in lockstep)
                 if attempt < self.retry_count:
-                    wait_time = self.retry_delay * (2**attempt)
+                    wait_time = min(
+                        _MAX_RETRY_DELAY,
+                        random.uniform(0.5, 1.5) * self.retry_delay * (2**attempt),
+                    )
                     logger.debug(f"Waiting {wait_time:.1f}s before retry")
                     time.sleep(wait_time)
                 else:
                     # Final attempt failed
                     logger.error(f"Download failed for {reel.shortcode} after all retries")
+                    if self.negative_cache_ttl > 0 and _PERMANENT_ERROR_PATTERN.search(
+                        error_msg
+                    ):
+                        self._negative_cache[reel.video_id] = time.time()
+                        self._negative_cache_dirty = True
                     if progress_bar:
                         progress_bar.set_postfix_str(f"✗ {reel.shortcode}")
                         progress_bar.update(1)
 
-                    return DownloadStatus(
+                    return DownloadStatus.model_construct(
                         video_id=reel.video_id,
                         success=False,
                         file_path=None,
@@ -201,7 +586,7 @@ class VideoDownloader:
                     )
 
         # Should not reach here
-        return DownloadStatus(
+        return DownloadStatus.model_construct(
             video_id=reel.video_id,
             success=False,
             file_path=None,
@@ -216,6 +601,27 @@ class VideoDownloader:
     ) -> DownloadReport:
         """Download multiple videos concurrently with resume capability.
 
+        Synchronous entry point that drives :meth:`download_batch_async` on a
+        fresh event loop.
+
+        Args:
+            reels: List of Reel metadata
+            show_progress: Show progress bar
+
+        Returns:
+            DownloadReport with statistics
+        """
+        return asyncio.run(self.download_batch_async(reels, show_progress=show_progress))
+
+    async def download_batch_async(
+        self, reels: List[ReelMetadata], show_progress: bool = True
+    ) -> DownloadReport:
+        """Download multiple videos concurrently from an asyncio event loop.
+
+        In-flight downloads are capped by a semaphore of ``max_workers`` (or the
+        autotuned count); each download runs the blocking :meth:`download_single`
+        in a worker thread.
+
         Args:
             reels: List of Reel metadata
             show_progress: Show progress bar
@@ -224,7 +630,7 @@ class VideoDownloader:
             DownloadReport with statistics
         """
         logger.info(f"Starting batch download of {len(reels)} videos")
-        report = DownloadReport(
+        report = DownloadReport.model_construct(
             total_videos=len(reels), started_at=datetime.now(), download_statuses=[]
         )
 
@@ -254,6 +660,43 @@ class VideoDownloader:
                     f"{len(reels_to_download)} remaining"
                 )
 
+        # Output paths are built once per batch and handed to the workers
+        video_paths = {reel.video_id: self._get_video_path(reel) for reel in reels_to_download}
+
+        # Skip videos already on disk with one directory scan instead of a stat per reel
+        if self.skip_existing and reels_to_download:
+            existing_sizes = self._scan_existing_videos()
+            pending = []
+            for reel in reels_to_download:
+                video_path = video_paths[reel.video_id]
+                file_size = existing_sizes.get(video_path.name)
+                if file_size is None:
+                    pending.append(reel)
+                    continue
+
+                report.download_statuses.append(
+                    DownloadStatus.model_construct(
+                        video_id=reel.video_id,
+                        success=True,
+                        file_path=video_path,
+                        file_size=file_size,
+                        download_time=0.0,
+                        error_message="Already downloaded (skipped)",
+                        retry_count=0,
+                    )
+                )
+                report.skipped += 1
+                if tracker:
+                    tracker.skip_item(reel.video_id, "Already downloaded")
+
+            if len(pending) < len(reels_to_download):
+                logger.info(
+                    f"Skipping {len(reels_to_download) - len(pending)} already downloaded videos"
+                )
+                if tracker:
+                    tracker.save(self.progress_file)
+            reels_to_download = pending
+
         # Create progress bar
         progress_bar = None
         if show_progress:
@@ -264,65 +707,109 @@ class VideoDownloader:
                 dynamic_ncols=True,
             )
 
-        try:
-            # Download videos concurrently
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all download tasks
-                future_to_reel = {
-                    executor.submit(self.download_single, reel, progress_bar): reel
-                    for reel in reels_to_download
-                }
+        workers = self.max_workers
+        if self.autotune and reels_to_download:
+            workers = await asyncio.to_thread(self._autotune_workers, reels_to_download[0])
+        # Never start more workers than there are videos to download
+        workers = max(1, min(workers, len(reels_to_download)))
+
+        loop = asyncio.get_running_loop()
+        # Dedicated pool: the loop's default executor may hold fewer threads than workers
+        executor = ThreadPoolExecutor(max_workers=workers)
+        semaphore = asyncio.Semaphore(workers)
+        # Extractor calls run on their own pool so resolving the next reels
+        # overlaps with downloading the current ones
+        resolve_executor = ThreadPoolExecutor(max_workers=workers)
+
+        async def run_download(reel: ReelMetadata) -> _DownloadResult:
+            info = await loop.run_in_executor(resolve_executor, self._resolve, reel)
+            async with semaphore:
+                try:
+                    status = await loop.run_in_executor(
+                        executor,
+                        self.download_single,
+                        reel,
+                        relay,
+                        video_paths[reel.video_id],
+                        info,
+                    )
+                    return reel, status
+                except Exception as e:
+                    return reel, e
+
+        # Workers report to the relay; only its thread touches the tqdm bar
+        relay = _ProgressRelay(progress_bar) if progress_bar else None
+
+        # Tracker updates and saves happen on a dedicated writer thread from here on
+        writer = ProgressWriter(tracker, self.progress_file) if tracker else None
+
+        async def iter_results() -> AsyncIterator[_DownloadResult]:
+            # Keep a bounded window of tasks in flight instead of one task per reel
+            pending_reels = iter(reels_to_download)
+            in_flight: "Set[asyncio.Task[_DownloadResult]]" = set()
+            while True:
+                for reel in pending_reels:
+                    in_flight.add(asyncio.create_task(run_download(reel)))
+                    if len(in_flight) >= workers * 2:
+                        break
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
 
-                # Process completed downloads
-                for future in as_completed(future_to_reel):
-                    reel = future_to_reel[future]
-                    try:
-                        # Mark as in progress
-                        if tracker:
-                            tracker.start_item(reel.video_id)
-                            tracker.save(self.progress_file)
-
-                        status = future.result()
-                        report.download_statuses.append(status)
-
-                        # Update statistics
-                        if status.success:
-                            if status.error_message == "Already downloaded (skipped)":
-                                report.skipped += 1
-                                if tracker:
-                                    tracker.skip_item(reel.video_id, "Already downloaded")
-                            else:
-                                report.successful += 1
-                                report.total_size += status.file_size
-                                if tracker:
-                                    tracker.complete_item(
-                                        reel.video_id,
-                                        {"file_path": str(status.file_path), "file_size": status.file_size},
-                                    )
+        try:
+            # Download videos concurrently and process them as they complete
+            async for reel, outcome in iter_results():
+                try:
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    status = outcome
+                    report.download_statuses.append(status)
+
+                    # Update statistics
+                    if status.success:
+                        if status.error_message == "Already downloaded (skipped)":
+                            report.skipped += 1
+                            if writer:
+                                writer.skip_item(reel.video_id, "Already downloaded")
                         else:
-                            report.failed += 1
-                            if tracker:
-                                tracker.fail_item(reel.video_id, status.error_message or "Unknown error")
-
-                        # Save progress after each item
-                        if tracker:
-                            tracker.save(self.progress_file)
-
-                    except Exception as e:
-                        logger.error(f"Error processing download result for {reel.shortcode}: {e}")
+                            report.successful += 1
+                            report.total_size += status.file_size
+                            if writer:
+                                writer.complete_item(
+                                    reel.video_id,
+                                    {"file_path": str(status.file_path), "file_size": status.file_size},
+                                )
+                    else:
                         report.failed += 1
-                        if tracker:
-                            tracker.fail_item(reel.video_id, str(e))
-                            tracker.save(self.progress_file)
+                        if writer:
+                            writer.fail_item(reel.video_id, status.error_message or "Unknown error")
+
+                except Exception as e:
+                    logger.error(f"Error processing download result for {reel.shortcode}: {e}")
+                    report.failed += 1
+                    if writer:
+                        writer.fail_item(reel.video_id, str(e))
 
         finally:
+            resolve_executor.shutdown(wait=True)
+            executor.shutdown(wait=True)
+
+            if relay:
+                relay.close()
             if progress_bar:
                 progress_bar.close()
 
-            # Mark stage as complete
-            if tracker:
-                tracker.complete()
-                tracker.save(self.progress_file)
+            self.close()
+            self._save_negative_cache()
+
+            # Mark stage as complete and persist the final snapshot
+            if writer:
+                writer.complete()
+                writer.close()
                 logger.info(f"Progress saved to {self.progress_file}")
 
         # Finalize report
@@ -346,8 +833,7 @@ class VideoDownloader:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report.model_dump(), f, indent=2, default=str)
+            output_path.write_bytes(dumps_json(report.model_dump(mode="json")))
 
             logger.info(f"Download report saved to {output_path}")
 
@@ -355,6 +841,27 @@ class VideoDownloader:
             logger.error(f"Failed to save download report: {e}")
 
 
+def iter_reels_from_json(json_path: Path) -> Iterator[ReelMetadata]:
+    """Iterate over Reels metadata stored in a JSON file.
+
+    Streams the array with ijson when it is installed, so large scrape
+    outputs are never fully resident; otherwise the file is parsed at once.
+
+    Args:
+        json_path: Path to reels_list.json file
+
+    Yields:
+        ReelMetadata instances
+    """
+    if ijson is None:
+        yield from map(ReelMetadata.model_validate, loads_json(json_path.read_bytes()))
+        return
+
+    with open(json_path, "rb") as f:
+        for reel_data in ijson.items(f, "item", use_float=True):
+            yield ReelMetadata.model_validate(reel_data)
+
+
 def load_reels_from_json(json_path: Path) -> List[ReelMetadata]:
     """Load Reels metadata from JSON file.
 
@@ -365,10 +872,7 @@ def load_reels_from_json(json_path: Path) -> List[ReelMetadata]:
         List of ReelMetadata instances
     """
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        reels = [ReelMetadata(**reel_data) for reel_data in data]
+        reels = list(iter_reels_from_json(json_path))
         logger.info(f"Loaded {len(reels)} Reels from {json_path}")
         return reels
 
@@ -1,12 +1,24 @@
 """Logging configuration for Instagram Reels Knowledge Base Creator."""
 
+import atexit
+import locale
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, Optional, Set, cast
 
 from .config import Config
 
+# Whether console output goes to a terminal, checked once at import
+_IS_TTY = sys.stdout.isatty()
+
+# Names of loggers already configured by setup_logger
+_configured: Set[str] = set()
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output."""
@@ -22,6 +34,34 @@ class ColoredFormatter(logging.Formatter):
     RESET = "\033[0m"
     BOLD = "\033[1m"
 
+    # Console format assembled directly, without the %-substitution engine
+    DEFAULT_FMT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        """Initialize formatter and precompute one colored formatter per level.
+
+        Args:
+            fmt: Log format string (%-style)
+            datefmt: Date format string
+        """
+        super().__init__(fmt=fmt, datefmt=datefmt)
+
+        # Bake the colors into the format string so records are never mutated
+        self._level_formatters: Dict[int, logging.Formatter] = {
+            logging.getLevelName(levelname): logging.Formatter(
+                fmt=self._style._fmt.replace(
+                    "%(levelname)s", f"{color}{self.BOLD}%(levelname)s{self.RESET}"
+                ),
+                datefmt=datefmt,
+            )
+            for levelname, color in self.COLORS.items()
+        }
+        self._colored_levels: Dict[int, str] = {
+            logging.getLevelName(levelname): f"{color}{self.BOLD}{levelname}{self.RESET}"
+            for levelname, color in self.COLORS.items()
+        }
+        self._fast_path = self._fmt == self.DEFAULT_FMT
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors.
 
@@ -31,20 +71,19 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Formatted log string
         """
-        # Add color to level name
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = (
-                f"{self.COLORS[levelname]}{self.BOLD}{levelname}{self.RESET}"
+        formatter = self._level_formatters.get(record.levelno)
+        if formatter is None:
+            return super().format(record)
+
+        # Exceptions and stack traces need the full Formatter machinery
+        if self._fast_path and not (record.exc_info or record.exc_text or record.stack_info):
+            return (
+                f"{self.formatTime(record, self.datefmt)} | "
+                f"{self._colored_levels[record.levelno]} | "
+                f"{record.name} | {record.getMessage()}"
             )
 
-        # Format the message
-        formatted = super().format(record)
-
-        # Reset levelname to original (for other handlers)
-        record.levelname = levelname
-
-        return formatted
+        return formatter.format(record)
 
 
 class ProgressFormatter(logging.Formatter):
@@ -67,6 +106,155 @@ class ProgressFormatter(logging.Formatter):
         return super().format(record)
 
 
+class CachedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler with a cheaper rollover check and buffered writes.
+
+    The stock check stats the log file and formats every record just to
+    measure it. Here the regular-file check is cached when the file is
+    opened, the file size is tracked as a running byte count (``tell()``
+    would flush the write buffer), and records are only formatted for the
+    size check once the file is within ``ROLLOVER_MARGIN`` bytes of
+    ``maxBytes``.
+
+    The file is opened in binary mode so each record is encoded exactly once,
+    and the encoded bytes are both written and counted. Writes go through a
+    ``BUFFER_SIZE`` buffer that is flushed immediately for errors; otherwise
+    the :class:`FlushingQueueListener` feeding the handler flushes it at most
+    ``FLUSH_INTERVAL`` seconds after a write.
+    """
+
+    # Distance from maxBytes at which records start being measured
+    ROLLOVER_MARGIN = 64 * 1024
+
+    # Write buffer size and the longest time records may sit in it
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL = 1.0
+
+    _is_regular_file = True
+    _bytes_written = 0
+
+    def _open(self) -> BinaryIO:  # type: ignore[override]
+        """Open the log file in binary mode with a large buffer and cache its type and size."""
+        stream = open(self.baseFilename, "wb" if "w" in self.mode else "ab", self.BUFFER_SIZE)
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        self._bytes_written = os.fstat(stream.fileno()).st_size if self._is_regular_file else 0
+        return stream
+
+    def _encode(self, msg: str) -> bytes:
+        """Encode text the way a text-mode stream with this handler's settings would.
+
+        Args:
+            msg: Text to encode
+
+        Returns:
+            Encoded bytes
+        """
+        # FileHandler stores "locale" when no encoding was given
+        encoding = self.encoding
+        if encoding is None or encoding == "locale":
+            encoding = locale.getpreferredencoding(False)
+        return msg.encode(encoding, self.errors or "strict")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record without flushing, except for errors.
+
+        Args:
+            record: Log record to write
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()  # type: ignore[assignment]
+            data = self._encode(self.format(record) + self.terminator)
+            cast(BinaryIO, self.stream).write(data)
+            self._bytes_written += len(data)
+
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Determine if rollover should occur.
+
+        Args:
+            record: Log record about to be written
+
+        Returns:
+            True if the file should be rotated before writing the record
+        """
+        if self.stream is None:
+            self.stream = self._open()  # type: ignore[assignment]
+        # Rotating devices or pipes (e.g. /dev/null) makes no sense
+        if self.maxBytes <= 0 or not self._is_regular_file:
+            return False
+
+        position = self._bytes_written
+        if position + self.ROLLOVER_MARGIN < self.maxBytes:
+            return False
+
+        return position + len(self._encode(self.format(record) + self.terminator)) >= (
+            self.maxBytes
+        )
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that also flushes its handlers from the listener thread.
+
+    Once a record has been handled, waiting for the next one is bounded by
+    ``flush_interval``; if that deadline passes, the handlers are flushed
+    before blocking again. Buffered records therefore reach the file at most
+    ``flush_interval`` seconds after they were handled, without a timer thread.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize listener.
+
+        Args:
+            log_queue: Queue to read records from
+            *handlers: Handlers records are dispatched to
+            respect_handler_level: Skip handlers whose level is above the record's
+            flush_interval: Longest time handled records may stay unflushed, in seconds
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self._log_queue = log_queue
+        self.flush_interval = flush_interval
+        self._flush_deadline: Optional[float] = None
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Return the next record, flushing handlers when the flush deadline passes.
+
+        Args:
+            block: Whether to wait for a record
+
+        Returns:
+            Next record from the queue
+        """
+        if self._flush_deadline is not None:
+            remaining = self._flush_deadline - time.monotonic()
+            if remaining > 0:
+                try:
+                    return self._log_queue.get(block, remaining)
+                except queue.Empty:
+                    pass
+            self._flush_deadline = None
+            for handler in self.handlers:
+                handler.flush()
+
+        record = self._log_queue.get(block)
+        self._flush_deadline = time.monotonic() + self.flush_interval
+        return record
+
+
 def setup_logger(
     name: str = "reels_scraper",
     config: Optional[Config] = None,
@@ -85,7 +273,8 @@ def setup_logger(
     logger = logging.getLogger(name)
 
     # Prevent duplicate handlers
-    if logger.handlers:
+    if name in _configured or logger.handlers:
+        _configured.add(name)
         return logger
 
     # Determine log level
@@ -103,9 +292,9 @@ def setup_logger(
     console_handler.setLevel(log_level)
 
     # Use colored formatter for console if not in a pipe
-    if sys.stdout.isatty():
+    if _IS_TTY:
         console_formatter = ColoredFormatter(
-            fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+            fmt=ColoredFormatter.DEFAULT_FMT,
             datefmt="%H:%M:%S",
         )
     else:
@@ -124,11 +313,12 @@ def setup_logger(
         # Create log directory if needed
         log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = CachedRotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
             encoding="utf-8",
+            delay=True,
         )
         file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
 
@@ -137,11 +327,23 @@ def setup_logger(
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        # Callers only enqueue records; a listener thread does the file I/O
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = FlushingQueueListener(
+            log_queue,
+            file_handler,
+            respect_handler_level=True,
+            flush_interval=CachedRotatingFileHandler.FLUSH_INTERVAL,
+        )
+        listener.start()
+        atexit.register(listener.stop)
 
     # Prevent propagation to root logger
     logger.propagate = False
 
+    _configured.add(name)
     return logger
 
 
@@ -154,17 +356,37 @@ def get_logger(name: str = "reels_scraper") -> logging.Logger:
     Returns:
         Logger instance
     """
-    logger = logging.getLogger(name)
-
     # If logger hasn't been set up yet, set it up with defaults
-    if not logger.handlers:
-        setup_logger(name)
+    if name not in _configured:
+        return setup_logger(name)
 
-    return logger
+    return logging.getLogger(name)
+
+
+class _MinimumLevelFilter(logging.Filter):
+    """Filter that drops records below a minimum level."""
+
+    def __init__(self, level: int):
+        """Initialize filter.
+
+        Args:
+            level: Minimum level of records to keep
+        """
+        super().__init__()
+        self.level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep records at or above the minimum level."""
+        return record.levelno >= self.level
 
 
 class LoggerContextManager:
-    """Context manager for temporary logger configuration."""
+    """Context manager for temporary logger configuration.
+
+    Raising the level installs a filter instead of calling setLevel, which would
+    clear the cached effective level of every logger. Lowering it still has to
+    go through setLevel.
+    """
 
     def __init__(self, logger: logging.Logger, level: int):
         """Initialize context manager.
@@ -176,15 +398,24 @@ class LoggerContextManager:
         self.logger = logger
         self.level = level
         self.original_level = logger.level
+        self._filter: Optional[_MinimumLevelFilter] = None
 
     def __enter__(self) -> logging.Logger:
         """Enter context and set new log level."""
-        self.logger.setLevel(self.level)
+        if self.level >= self.logger.getEffectiveLevel():
+            self._filter = _MinimumLevelFilter(self.level)
+            self.logger.addFilter(self._filter)
+        else:
+            self.logger.setLevel(self.level)
         return self.logger
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit context and restore original log level."""
-        self.logger.setLevel(self.original_level)
+        if self._filter is not None:
+            self.logger.removeFilter(self._filter)
+            self._filter = None
+        else:
+            self.logger.setLevel(self.original_level)
 
 
 def set_verbose(logger: logging.Logger, verbose: bool = True) -> None:
@@ -200,6 +431,3 @@ def set_verbose(logger: logging.Logger, verbose: bool = True) -> None:
         if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
             handler.setLevel(level)
 
-
-# Import handlers for rotating logs
-import logging.handlers  # noqa: E402
@@ -2,10 +2,11 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, model_validator
 
 
 # ==================== Instagram Models ====================
@@ -25,13 +26,13 @@ class ProfileMetadata(BaseModel):
     is_business: bool = Field(default=False, description="Business account status")
     scraped_at: datetime = Field(default_factory=datetime.now, description="Scraping timestamp")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class ReelMetadata(BaseModel):
     """Instagram Reel metadata."""
 
+    # Built once and only read afterwards
+    model_config = ConfigDict(frozen=True)
+
     video_id: str = Field(..., description="Unique video identifier")
     shortcode: str = Field(..., description="Instagram shortcode")
     url: str = Field(..., description="Video URL")
@@ -45,8 +46,15 @@ class ReelMetadata(BaseModel):
     thumbnail_url: Optional[str] = Field(default=None, description="Thumbnail URL")
     owner_username: str = Field(default="", description="Video owner username")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @cached_property
+    def date_ymd(self) -> str:
+        """Get publication date as YYYYMMDD (computed once)."""
+        return self.timestamp.strftime("%Y%m%d")
+
+    @cached_property
+    def date_iso(self) -> str:
+        """Get publication date as YYYY-MM-DD (computed once)."""
+        return self.timestamp.strftime("%Y-%m-%d")
 
 
 # ==================== Download Models ====================
@@ -55,6 +63,9 @@ class ReelMetadata(BaseModel):
 class DownloadStatus(BaseModel):
     """Status of a video download."""
 
+    # Built once and only read afterwards
+    model_config = ConfigDict(frozen=True)
+
     video_id: str = Field(..., description="Video identifier")
     success: bool = Field(..., description="Download success status")
     file_path: Optional[Path] = Field(default=None, description="Downloaded file path")
@@ -64,9 +75,6 @@ class DownloadStatus(BaseModel):
     retry_count: int = Field(default=0, ge=0, description="Number of retries")
     timestamp: datetime = Field(default_factory=datetime.now, description="Download timestamp")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat(), Path: lambda v: str(v)}
-
 
 class DownloadReport(BaseModel):
     """Report of batch download operation."""
@@ -83,9 +91,6 @@ class DownloadReport(BaseModel):
     started_at: datetime = Field(default_factory=datetime.now, description="Start timestamp")
     completed_at: Optional[datetime] = Field(default=None, description="Completion timestamp")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 # ==================== Transcription Models ====================
 
@@ -98,6 +103,15 @@ class TranscriptSegment(BaseModel):
     text: str = Field(..., description="Transcript text for this segment")
     speaker: Optional[str] = Field(default=None, description="Speaker identifier if detected")
 
+    # MM:SS start time, computed once at validation
+    _formatted_start: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _cache_formatted_start(self) -> "TranscriptSegment":
+        """Precompute the formatted start time."""
+        self._formatted_start = self.formatted_time(self.start_time)
+        return self
+
     def formatted_time(self, seconds: float) -> str:
         """Format seconds as MM:SS.
 
@@ -114,7 +128,8 @@ class TranscriptSegment(BaseModel):
     @property
     def formatted_start(self) -> str:
         """Get formatted start time."""
-        return self.formatted_time(self.start_time)
+        # Instances built with model_construct skip the validator
+        return self._formatted_start or self.formatted_time(self.start_time)
 
     @property
     def formatted_end(self) -> str:
@@ -125,6 +140,9 @@ class TranscriptSegment(BaseModel):
 class Transcript(BaseModel):
     """Complete transcript of a video."""
 
+    # Built once and only read afterwards
+    model_config = ConfigDict(frozen=True)
+
     video_id: str = Field(..., description="Video identifier")
     text: str = Field(..., description="Full transcript text")
     language: str = Field(..., description="Detected or specified language code")
@@ -138,9 +156,6 @@ class Transcript(BaseModel):
     model: str = Field(default="", description="Model used for transcription")
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
     def get_formatted_transcript(self) -> str:
         """Get transcript formatted with timestamps.
 
@@ -150,10 +165,9 @@ class Transcript(BaseModel):
         if not self.segments:
             return self.text
 
-        lines = []
-        for segment in self.segments:
-            lines.append(f"[{segment.formatted_start}] {segment.text}")
-        return "\n".join(lines)
+        return "\n".join(
+            f"[{segment.formatted_start}] {segment.text}" for segment in self.segments
+        )
 
 
 # ==================== Content Processing Models ====================
@@ -172,14 +186,11 @@ class MarkdownReport(BaseModel):
     file_path: Optional[Path] = Field(default=None, description="Path to markdown file")
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat(), Path: lambda v: str(v)}
-
 
 # ==================== Pipeline Models ====================
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorLog:
     """Error log entry."""
 
@@ -202,7 +213,7 @@ class ErrorLog:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     """State of the processing pipeline."""
 
@@ -220,14 +231,14 @@ class PipelineState:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "profile": self.profile.model_dump() if self.profile else None,
+            "profile": self.profile.model_dump(mode="json") if self.profile else None,
             "reels_discovered": self.reels_discovered,
             "reels_downloaded": self.reels_downloaded,
             "reels_transcribed": self.reels_transcribed,
             "reels_processed": self.reels_processed,
             "started_at": self.started_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "errors": [e.to_dict() for e in self.errors],
+            "errors": list(map(ErrorLog.to_dict, self.errors)),
             "current_stage": self.current_stage,
             "output_dir": str(self.output_dir) if self.output_dir else None,
         }
@@ -248,7 +259,7 @@ class PipelineState:
 # ==================== Statistics Models ====================
 
 
-@dataclass
+@dataclass(slots=True)
 class Statistics:
     """Knowledge base statistics."""
 
@@ -282,9 +293,8 @@ class Statistics:
     @staticmethod
     def _format_duration(seconds: float) -> str:
         """Format duration in human-readable format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, secs = divmod(remainder, 60)
 
         if hours > 0:
             return f"{hours}h {minutes}m {secs}s"
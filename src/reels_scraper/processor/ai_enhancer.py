@@ -1,13 +1,179 @@
 """AI enhancement for content summarization and topic extraction."""
 
-from typing import Dict, List
+import asyncio
+import functools
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 import google.generativeai as genai
 
 from ..logger import get_logger
+from ..serialization import dumps_json, loads_json
 
 logger = get_logger(__name__)
 
+# Most responses kept in memory per enhancer; older ones are re-read from disk
+_MEMORY_CACHE_SIZE = 4096
+
+# Ask Gemini for a JSON response when all enhancements are requested at once
+_JSON_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+
+# One key point per line: optional bullet marker, surrounding whitespace dropped
+_KEY_POINT_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:[-*•·][^\S\n]*)?(?![-*•·][^\S\n]*$)(\S[^\n]*?)[^\S\n]*$", re.M
+)
+
+# One topic per line: optional '#' prefix, surrounding whitespace dropped.
+# Lines made only of '#' are skipped.
+_TOPIC_LINE_RE = re.compile(r"^[^\S\n]*#*[^\S\n]*(?!#)(\S[^\n]*?)[^\S\n]*$", re.M)
+
+
+def _copy_response(value: Any) -> Any:
+    """Copy a cached response so callers cannot mutate the cache entry.
+
+    Responses are strings, lists of strings, or dicts of those.
+
+    Args:
+        value: Cached response
+
+    Returns:
+        Copy of the response
+    """
+    if isinstance(value, dict):
+        return {k: list(v) if isinstance(v, list) else v for k, v in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def _clean_key_points(text: str, max_points: int) -> List[str]:
+    """Strip bullet markers and blank lines from key points.
+
+    Args:
+        text: Raw key points, one per line
+        max_points: Maximum number of key points
+
+    Returns:
+        List of key points
+    """
+    matches = islice(_KEY_POINT_LINE_RE.finditer(text), max_points)
+    return [match.group(1) for match in matches]
+
+
+def _clean_topics(text: str, max_topics: int) -> List[str]:
+    """Normalize topics to lowercase, underscore-separated tags without '#'.
+
+    Args:
+        text: Raw topics, one per line
+        max_topics: Maximum number of topics
+
+    Returns:
+        List of topic tags
+    """
+    matches = islice(_TOPIC_LINE_RE.finditer(text), max_topics)
+    return [match.group(1).lower().replace(" ", "_") for match in matches]
+
+
+# Digest of the API key genai is currently configured with
+_configured_key: Optional[str] = None
+
+
+def _configure_genai(api_key: str) -> str:
+    """Configure the Gemini client once per distinct API key.
+
+    Args:
+        api_key: Google API key
+
+    Returns:
+        Digest identifying the configured key
+    """
+    global _configured_key
+
+    key_digest = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
+    if key_digest != _configured_key:
+        # genai keeps one client per service and reuses its gRPC channel. The
+        # transport is left at its default so the async client gets grpc_asyncio.
+        genai.configure(api_key=api_key)
+        _configured_key = key_digest
+    return key_digest
+
+
+@functools.lru_cache(maxsize=8)
+def _get_model(model_name: str, key_digest: str) -> "genai.GenerativeModel":
+    """Get a shared Gemini model instance.
+
+    Models bind their client lazily, so the key digest is part of the cache key.
+
+    Args:
+        model_name: Gemini model name
+        key_digest: Digest returned by _configure_genai
+
+    Returns:
+        Gemini model instance
+    """
+    return genai.GenerativeModel(model_name)
+
+
+class _RequestThrottle:
+    """Thread-safe limiter that spaces requests evenly at a maximum rate."""
+
+    def __init__(self, requests_per_second: float):
+        """Initialize throttle.
+
+        Args:
+            requests_per_second: Maximum request rate (0 or less disables throttling)
+        """
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve the next request slot.
+
+        Returns:
+            Seconds the caller must wait before issuing its request
+        """
+        if not self.interval:
+            return 0.0
+
+        # Reserve a slot under the lock; callers sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        return slot - now
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """Wait, without blocking the event loop, until the next request may be issued."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class _Request(NamedTuple):
+    """One standalone Gemini request and how to handle its response."""
+
+    name: str
+    key: str
+    prompt: str
+    parse: Callable[[str], Any]
+    default: Any
+
 
 class AIEnhancer:
     """Enhance content using Google Gemini for summarization and topic extraction."""
@@ -17,6 +183,9 @@ class AIEnhancer:
         api_key: str,
         model: str = "gemini-2.0-flash-exp",
         max_summary_length: int = 500,
+        cache_dir: Optional[Path] = None,
+        max_input_chars: int = 200_000,
+        requests_per_second: float = 0.0,
     ):
         """Initialize AI enhancer.
 
@@ -24,31 +193,130 @@ class AIEnhancer:
             api_key: Google API key
             model: Gemini model to use
             max_summary_length: Maximum summary length in words
+            cache_dir: Directory for cached responses (in-memory only if omitted)
+            max_input_chars: Longest transcript sent to the model (~50k tokens by default)
+            requests_per_second: Maximum Gemini API calls per second, shared by all
+                threads and tasks using this enhancer (0 for unlimited)
         """
         self.model_name = model
         self.max_summary_length = max_summary_length
+        self.cache_dir = cache_dir
+        self.max_input_chars = max_input_chars
+        self._throttle = _RequestThrottle(requests_per_second)
 
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model)
+        # Responses keyed by _cache_key, so identical transcripts are never re-sent;
+        # least recently used entries are evicted past _MEMORY_CACHE_SIZE
+        self._memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.debug(f"AI enhancer initialized: {model}")
+        # Configure Gemini, reusing the client and model across instances
+        self.model = _get_model(model, _configure_genai(api_key))
 
-    def generate_summary(self, transcript_text: str, language: str = "en") -> str:
-        """Generate executive summary from transcript.
+        logger.debug("AI enhancer initialized: %s", model)
+
+    def _fit_transcript(self, transcript_text: str) -> str:
+        """Truncate a transcript to max_input_chars, at a word boundary if possible.
 
         Args:
             transcript_text: Full transcript text
-            language: Language code for output
 
         Returns:
-            Generated summary text
+            Transcript text that fits the input budget
         """
-        logger.info(f"Generating summary (max {self.max_summary_length} words)")
+        if len(transcript_text) <= self.max_input_chars:
+            return transcript_text
 
-        try:
-            # Build prompt
-            prompt = f"""Please provide a concise executive summary of the following video transcript.
+        truncated = transcript_text[: self.max_input_chars]
+        boundary = truncated.rfind(" ")
+        if boundary > self.max_input_chars // 2:
+            truncated = truncated[:boundary]
+
+        logger.warning(
+            "Transcript truncated from %d to %d characters for AI enhancement",
+            len(transcript_text),
+            len(truncated),
+        )
+        return truncated
+
+    def _cache_key(self, kind: str, transcript_text: str, *params: Any) -> str:
+        """Build the cache key for one kind of response.
+
+        Args:
+            kind: Response kind (e.g. "summary", "enhance")
+            transcript_text: Full transcript text
+            *params: Parameters that change the response
+
+        Returns:
+            Hex digest identifying the request
+        """
+        parts = [kind, self.model_name, *map(str, params), transcript_text]
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Look up a cached response in memory, then on disk.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached value, or None on a miss
+        """
+        with self._memory_cache_lock:
+            if key in self._memory_cache:
+                self._memory_cache.move_to_end(key)
+                return _copy_response(self._memory_cache[key])
+
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            try:
+                value = loads_json(cache_file.read_bytes())
+            except FileNotFoundError:
+                return None
+            except Exception as e:
+                logger.warning("Ignoring unreadable AI cache entry %s: %s", cache_file, e)
+                return None
+            self._remember(key, value)
+            return _copy_response(value)
+
+        return None
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Store a response in the in-memory LRU cache.
+
+        Args:
+            key: Cache key
+            value: Response, owned by the cache from now on
+        """
+        with self._memory_cache_lock:
+            self._memory_cache[key] = value
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+    def _cache_put(self, key: str, value: Any) -> None:
+        """Store a response in memory and, atomically, on disk.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable response
+        """
+        # Callers keep using value, so the cache holds its own copy
+        self._remember(key, _copy_response(value))
+
+        if self.cache_dir:
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(dumps_json(value, indent=False))
+                os.replace(tmp_path, self.cache_dir / f"{key}.json")
+            except Exception as e:
+                logger.warning("Failed to write AI cache entry %s: %s", key, e)
+
+    def _summary_prompt(self, transcript_text: str, language: str) -> str:
+        """Build the prompt for an executive summary."""
+        return f"""Please provide a concise executive summary of the following video transcript.
 
 Language: {language}
 Maximum length: {self.max_summary_length} words
@@ -63,64 +331,208 @@ Transcript:
 
 Provide the summary in the same language as the transcript."""
 
-            # Generate summary
-            response = self.model.generate_content(prompt)
-            summary = response.text.strip()
+    @staticmethod
+    def _key_points_prompt(transcript_text: str, max_points: int) -> str:
+        """Build the prompt for key takeaways."""
+        return f"""Extract the {max_points} most important key takeaways from this video transcript.
 
-            word_count = len(summary.split())
-            logger.info(f"Summary generated ({word_count} words)")
+Provide them as a bulleted list (one point per line, starting with "-").
+Be concise and specific.
+
+Transcript:
+{transcript_text}
 
-            return summary
+Key takeaways:"""
 
-        except Exception as e:
-            logger.error(f"Failed to generate summary: {e}")
-            return "Summary generation failed"
+    @staticmethod
+    def _topics_prompt(transcript_text: str, max_topics: int) -> str:
+        """Build the prompt for topic hashtags."""
+        return f"""Identify the {max_topics} main topics or themes in this video transcript.
 
-    def extract_key_points(self, transcript_text: str, max_points: int = 5) -> List[str]:
-        """Extract key takeaways from transcript.
+Provide them as simple hashtags (e.g., #technology, #education).
+One topic per line.
+
+Transcript:
+{transcript_text}
+
+Topics:"""
+
+    def _fused_prompt(
+        self, transcript_text: str, language: str, max_points: int, max_topics: int
+    ) -> str:
+        """Build the prompt that requests every enhancement as one JSON object."""
+        return f"""Analyze the following video transcript.
+
+Language: {language}
+
+Provide:
+- "summary": a concise executive summary of at most {self.max_summary_length} words, focusing on
+  the main topic and purpose, key points discussed, and important conclusions or takeaways.
+  Write it in the same language as the transcript.
+- "key_points": the {max_points} most important key takeaways, concise and specific.
+- "topics": the {max_topics} main topics or themes as simple tags (e.g., technology, education).
+
+Transcript:
+{transcript_text}
+
+Respond with strict JSON: {{"summary": str, "key_points": [str], "topics": [str]}}"""
+
+    @staticmethod
+    def _parse_fused(text: str, max_points: int, max_topics: int) -> Dict[str, Any]:
+        """Parse the JSON response to the fused prompt.
 
         Args:
-            transcript_text: Full transcript text
+            text: Response text
             max_points: Maximum number of key points
+            max_topics: Maximum number of topics
 
         Returns:
-            List of key points
+            Dictionary with summary, key_points, and topics
+
+        Raises:
+            ValueError: If the response is not the expected JSON object
         """
-        logger.info(f"Extracting up to {max_points} key points")
+        data = loads_json(text)
+        if not isinstance(data, dict) or not isinstance(data.get("summary"), str):
+            raise ValueError("Response is not a JSON object with a summary")
+
+        summary = data["summary"].strip()
+        key_points = _clean_key_points("\n".join(data.get("key_points") or []), max_points)
+        topics = _clean_topics("\n".join(data.get("topics") or []), max_topics)
+
+        logger.info(
+            "Enhanced content in one request: %d word summary, %d key points, %d topics",
+            len(summary.split()),
+            len(key_points),
+            len(topics),
+        )
+        return {"summary": summary, "key_points": key_points, "topics": topics}
+
+    def _summary_request(self, transcript_text: str, language: str) -> _Request:
+        """Describe the standalone executive summary request."""
+        return _Request(
+            name="summary",
+            key=self._cache_key("summary", transcript_text, language, self.max_summary_length),
+            prompt=self._summary_prompt(transcript_text, language),
+            parse=str.strip,
+            default="Summary generation failed",
+        )
+
+    def _key_points_request(self, transcript_text: str, max_points: int) -> _Request:
+        """Describe the standalone key points request."""
+        return _Request(
+            name="key points",
+            key=self._cache_key("key_points", transcript_text, max_points),
+            prompt=self._key_points_prompt(transcript_text, max_points),
+            parse=lambda text: _clean_key_points(text, max_points),
+            default=[],
+        )
+
+    def _topics_request(self, transcript_text: str, max_topics: int) -> _Request:
+        """Describe the standalone topics request."""
+        return _Request(
+            name="topics",
+            key=self._cache_key("topics", transcript_text, max_topics),
+            prompt=self._topics_prompt(transcript_text, max_topics),
+            parse=lambda text: _clean_topics(text, max_topics),
+            default=[],
+        )
+
+    def _fallback_requests(self, transcript_text: str, language: str) -> List[_Request]:
+        """Describe the separate requests used when the combined one fails."""
+        return [
+            self._summary_request(transcript_text, language),
+            self._key_points_request(transcript_text, 5),
+            self._topics_request(transcript_text, 5),
+        ]
+
+    def _generate(self, prompt: str, **kwargs: Any) -> Any:
+        """Call the Gemini API once, within the request rate limit."""
+        self._throttle.wait()
+        return self.model.generate_content(prompt, **kwargs)
+
+    async def _generate_async(self, prompt: str, **kwargs: Any) -> Any:
+        """Call the async Gemini API once, within the request rate limit."""
+        await self._throttle.wait_async()
+        return await self.model.generate_content_async(prompt, **kwargs)
+
+    def _run(self, request: _Request) -> Any:
+        """Answer one standalone request from the cache or the API.
 
+        Args:
+            request: Request description
+
+        Returns:
+            Parsed response, or the request's default if the call fails
+        """
+        cached = self._cache_get(request.key)
+        if cached is not None:
+            logger.debug("Using cached %s", request.name)
+            return cached
+
+        logger.info("Generating %s", request.name)
         try:
-            prompt = f"""Extract the {max_points} most important key takeaways from this video transcript.
+            # .text raises for blocked or safety-filtered responses
+            result = request.parse(self._generate(request.prompt).text)
+        except Exception as e:
+            logger.error("Failed to generate %s: %s", request.name, e)
+            return request.default
 
-Provide them as a bulleted list (one point per line, starting with "-").
-Be concise and specific.
+        self._cache_put(request.key, result)
+        return result
 
-Transcript:
-{transcript_text}
+    async def _run_async(self, request: _Request) -> Any:
+        """Answer one standalone request from the cache or the async API.
 
-Key takeaways:"""
+        Args:
+            request: Request description
 
-            response = self.model.generate_content(prompt)
-            text = response.text.strip()
+        Returns:
+            Parsed response, or the request's default if the call fails
+        """
+        cached = self._cache_get(request.key)
+        if cached is not None:
+            logger.debug("Using cached %s", request.name)
+            return cached
 
-            # Parse bullet points
-            key_points = []
-            for line in text.split("\n"):
-                line = line.strip()
-                # Remove common bullet point markers
-                for marker in ["-", "*", "•", "·"]:
-                    if line.startswith(marker):
-                        line = line[1:].strip()
-                        break
+        logger.info("Generating %s", request.name)
+        try:
+            response = await self._generate_async(request.prompt)
+            result = request.parse(response.text)
+        except Exception as e:
+            logger.error("Failed to generate %s: %s", request.name, e)
+            return request.default
 
-                if line and len(key_points) < max_points:
-                    key_points.append(line)
+        self._cache_put(request.key, result)
+        return result
 
-            logger.info(f"Extracted {len(key_points)} key points")
-            return key_points
+    def generate_summary(self, transcript_text: str, language: str = "en") -> str:
+        """Generate executive summary from transcript.
 
-        except Exception as e:
-            logger.error(f"Failed to extract key points: {e}")
-            return []
+        Args:
+            transcript_text: Full transcript text
+            language: Language code for output
+
+        Returns:
+            Generated summary text
+        """
+        transcript_text = self._fit_transcript(transcript_text)
+        summary: str = self._run(self._summary_request(transcript_text, language))
+        return summary
+
+    def extract_key_points(self, transcript_text: str, max_points: int = 5) -> List[str]:
+        """Extract key takeaways from transcript.
+
+        Args:
+            transcript_text: Full transcript text
+            max_points: Maximum number of key points
+
+        Returns:
+            List of key points
+        """
+        transcript_text = self._fit_transcript(transcript_text)
+        key_points: List[str] = self._run(self._key_points_request(transcript_text, max_points))
+        return key_points
 
     def extract_topics(self, transcript_text: str, max_topics: int = 5) -> List[str]:
         """Extract main topics/tags from transcript.
@@ -132,48 +544,62 @@ Key takeaways:"""
         Returns:
             List of topic tags
         """
-        logger.info(f"Extracting up to {max_topics} topics")
+        transcript_text = self._fit_transcript(transcript_text)
+        topics: List[str] = self._run(self._topics_request(transcript_text, max_topics))
+        return topics
 
-        try:
-            prompt = f"""Identify the {max_topics} main topics or themes in this video transcript.
+    def _enhance_key(self, transcript_text: str, language: str) -> str:
+        """Build the cache key for a combined enhancement."""
+        return self._cache_key("enhance", transcript_text, language, self.max_summary_length)
 
-Provide them as simple hashtags (e.g., #technology, #education).
-One topic per line.
-
-Transcript:
-{transcript_text}
-
-Topics:"""
-
-            response = self.model.generate_content(prompt)
-            text = response.text.strip()
+    def enhance_content(self, transcript_text: str, language: str = "en") -> Dict[str, Any]:
+        """Perform complete content enhancement.
 
-            # Parse topics
-            topics = []
-            for line in text.split("\n"):
-                line = line.strip()
+        Summary, key points and topics are requested together in one call; if
+        that response can't be parsed, the individual requests are issued
+        concurrently.
 
-                # Clean up topic
-                if line:
-                    # Remove # if present
-                    topic = line.lstrip("#").strip()
-                    # Convert to lowercase and remove spaces
-                    topic = topic.lower().replace(" ", "_")
+        Args:
+            transcript_text: Full transcript text
+            language: Language code
 
-                    if topic and len(topics) < max_topics:
-                        topics.append(topic)
+        Returns:
+            Dictionary with summary, key_points, and topics
+        """
+        transcript_text = self._fit_transcript(transcript_text)
+        key = self._enhance_key(transcript_text, language)
+        cached: Optional[Dict[str, Any]] = self._cache_get(key)
+        if cached is not None:
+            logger.info("Using cached content enhancement")
+            return cached
 
-            logger.info(f"Extracted {len(topics)} topics: {', '.join(topics)}")
-            return topics
+        logger.info("Performing complete content enhancement")
 
+        try:
+            response = self._generate(
+                self._fused_prompt(transcript_text, language, 5, 5),
+                generation_config=_JSON_GENERATION_CONFIG,
+            )
+            result = self._parse_fused(response.text, 5, 5)
+            self._cache_put(key, result)
+            return result
         except Exception as e:
-            logger.error(f"Failed to extract topics: {e}")
-            return []
+            logger.warning("Combined enhancement failed, falling back to separate requests: %s", e)
 
-    def enhance_content(
+        # Issue the separate requests concurrently; latency is the slowest request
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            summary, key_points, topics = executor.map(
+                self._run, self._fallback_requests(transcript_text, language)
+            )
+        return {"summary": summary, "key_points": key_points, "topics": topics}
+
+    async def enhance_content_async(
         self, transcript_text: str, language: str = "en"
-    ) -> Dict[str, any]:
-        """Perform complete content enhancement.
+    ) -> Dict[str, Any]:
+        """Perform complete content enhancement from an asyncio event loop.
+
+        Same behavior as :meth:`enhance_content`, using Gemini's async API so the
+        fallback requests overlap on the caller's loop.
 
         Args:
             transcript_text: Full transcript text
@@ -182,20 +608,27 @@ Topics:"""
         Returns:
             Dictionary with summary, key_points, and topics
         """
+        transcript_text = self._fit_transcript(transcript_text)
+        key = self._enhance_key(transcript_text, language)
+        cached: Optional[Dict[str, Any]] = self._cache_get(key)
+        if cached is not None:
+            logger.info("Using cached content enhancement")
+            return cached
+
         logger.info("Performing complete content enhancement")
 
         try:
-            # Generate all enhancements
-            summary = self.generate_summary(transcript_text, language)
-            key_points = self.extract_key_points(transcript_text)
-            topics = self.extract_topics(transcript_text)
-
-            return {"summary": summary, "key_points": key_points, "topics": topics}
-
+            response = await self._generate_async(
+                self._fused_prompt(transcript_text, language, 5, 5),
+                generation_config=_JSON_GENERATION_CONFIG,
+            )
+            result = self._parse_fused(response.text, 5, 5)
+            self._cache_put(key, result)
+            return result
         except Exception as e:
-            logger.error(f"Content enhancement failed: {e}")
-            return {
-                "summary": "Enhancement failed",
-                "key_points": [],
-                "topics": [],
-            }
+            logger.warning("Combined enhancement failed, falling back to separate requests: %s", e)
+
+        summary, key_points, topics = await asyncio.gather(
+            *map(self._run_async, self._fallback_requests(transcript_text, language))
+        )
+        return {"summary": summary, "key_points": key_points, "topics": topics}
@@ -1,17 +1,26 @@
 """Markdown report generator using Jinja2 templates."""
 
-import json
+import functools
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set
 
 from jinja2 import Environment, FileSystemLoader, Template
+from pydantic import TypeAdapter
 
 from ..logger import get_logger
 from ..models import MarkdownReport, ReelMetadata, Transcript
 
 logger = get_logger(__name__)
 
+# Templates ship with the package, so one environment serves every generator
+# and never needs to re-stat the template files
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+_ENV = Environment(loader=FileSystemLoader(str(_TEMPLATE_DIR)), auto_reload=False, cache_size=-1)
+
+# Parses and validates a whole reels_list.json in one pass inside pydantic-core
+_REEL_LIST_ADAPTER = TypeAdapter(List[ReelMetadata])
+
 
 class MarkdownGenerator:
     """Generate markdown reports from transcripts and metadata."""
@@ -24,11 +33,16 @@ class MarkdownGenerator:
         """
         self.template_name = template_name
 
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent / "templates"
-        self.env = Environment(loader=FileSystemLoader(str(template_dir)))
+        # Shared Jinja2 environment
+        self.env = _ENV
+
+        # Compiled once and reused for every report
+        self._template = self._load_template()
 
-        logger.debug(f"Markdown generator initialized with template: {template_name}")
+        # Output directories already created by save_report
+        self._ensured_dirs: Set[Path] = set()
+
+        logger.debug("Markdown generator initialized with template: %s", template_name)
 
     def _load_template(self) -> Template:
         """Load Jinja2 template.
@@ -42,14 +56,16 @@ class MarkdownGenerator:
             template = self.env.get_template(template_file)
             return template
         except Exception as e:
-            logger.error(f"Failed to load template {template_file}: {e}")
+            logger.error("Failed to load template %s: %s", template_file, e)
             raise
 
-    def _format_duration(self, seconds: float) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_duration(seconds: int) -> str:
         """Format duration in human-readable format.
 
         Args:
-            seconds: Duration in seconds
+            seconds: Duration in whole seconds
 
         Returns:
             Formatted duration string
@@ -78,8 +94,10 @@ class MarkdownGenerator:
             Generated title
         """
         if reel and reel.caption:
-            # Use first line of caption as title
-            title = reel.caption.split("\n")[0].strip()
+            # Use first line of caption as title, without splitting the whole caption
+            caption = reel.caption
+            newline = caption.find("\n")
+            title = (caption if newline < 0 else caption[:newline]).strip()
             # Limit length
             if len(title) > 100:
                 title = title[:97] + "..."
@@ -102,7 +120,7 @@ class MarkdownGenerator:
         """
         # Use date from reel metadata
         if reel:
-            date_str = reel.timestamp.strftime("%Y%m%d")
+            date_str = reel.date_ymd
             # Clean shortcode for filename
             shortcode = reel.shortcode.replace("/", "_")
             return f"{date_str}_{shortcode}.md"
@@ -117,6 +135,7 @@ class MarkdownGenerator:
         key_points: list[str],
         topics: list[str],
         reel: Optional[ReelMetadata] = None,
+        generated_at: Optional[str] = None,
     ) -> MarkdownReport:
         """Generate markdown report.
 
@@ -126,35 +145,43 @@ class MarkdownGenerator:
             key_points: List of key takeaways
             topics: List of topic tags
             reel: Optional reel metadata
+            generated_at: Generation timestamp, shared by a batch (defaults to now)
 
         Returns:
             MarkdownReport object
         """
-        logger.info(f"Generating markdown report for video {transcript.video_id}")
+        logger.debug("Generating markdown report for video %s", transcript.video_id)
 
         try:
-            # Load template
-            template = self._load_template()
-
             # Create title and filename
             title = self._create_title(reel, transcript)
             filename = self._create_filename(reel, transcript)
 
             # Prepare metadata
-            metadata = {
-                "profile": reel.owner_username if reel else "unknown",
-                "date": reel.timestamp.strftime("%Y-%m-%d") if reel else "unknown",
-                "duration": self._format_duration(transcript.duration),
-                "url": reel.url if reel else "N/A",
-                "views": f"{reel.view_count:,}" if reel else None,
-                "likes": f"{reel.like_count:,}" if reel else None,
-            }
+            duration = self._format_duration(int(transcript.duration))
+            if reel:
+                metadata = {
+                    "profile": reel.owner_username,
+                    "date": reel.date_iso,
+                    "duration": duration,
+                    "url": reel.url,
+                    "views": format(reel.view_count, ","),
+                    "likes": format(reel.like_count, ","),
+                }
+            else:
+                # Views and likes are left out; the template shows N/A
+                metadata = {
+                    "profile": "unknown",
+                    "date": "unknown",
+                    "duration": duration,
+                    "url": "N/A",
+                }
 
             # Get formatted transcript
             formatted_transcript = transcript.get_formatted_transcript()
 
             # Render template
-            content = template.render(
+            content = self._template.render(
                 title=title,
                 metadata=metadata,
                 summary=summary,
@@ -162,9 +189,9 @@ class MarkdownGenerator:
                 key_points=key_points,
                 topics=topics,
                 language=transcript.language,
-                word_count=f"{transcript.word_count:,}",
+                word_count=format(transcript.word_count, ","),
                 service=transcript.service,
-                generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                generated_at=generated_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             )
 
             # Create report
@@ -179,11 +206,11 @@ class MarkdownGenerator:
                 file_path=None,  # Will be set when saved
             )
 
-            logger.info(f"Markdown report generated: {filename}")
+            logger.info("Markdown report generated: %s", filename)
             return report
 
         except Exception as e:
-            logger.error(f"Failed to generate markdown report: {e}")
+            logger.error("Failed to generate markdown report: %s", e)
             raise
 
     def save_report(self, report: MarkdownReport, output_dir: Path) -> Path:
@@ -196,7 +223,9 @@ class MarkdownGenerator:
         Returns:
             Path to saved file
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if output_dir not in self._ensured_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
 
         # Generate filename
         filename = f"{report.video_id}.md"
@@ -207,11 +236,10 @@ class MarkdownGenerator:
         output_path = output_dir / filename
 
         try:
-            # Save markdown content
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(report.content)
+            # Save markdown content, encoded up front and written in one call
+            output_path.write_bytes(report.content.encode("utf-8"))
 
-            logger.info(f"Markdown report saved to {output_path}")
+            logger.info("Markdown report saved to %s", output_path)
 
             # Update report with file path
             report.file_path = output_path
@@ -219,7 +247,7 @@ class MarkdownGenerator:
             return output_path
 
         except Exception as e:
-            logger.error(f"Failed to save markdown report: {e}")
+            logger.error("Failed to save markdown report: %s", e)
             raise
 
 
@@ -233,17 +261,12 @@ def load_reel_metadata_from_json(json_path: Path) -> Dict[str, ReelMetadata]:
         Dictionary mapping video_id to ReelMetadata
     """
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        reels_dict = {}
-        for reel_data in data:
-            reel = ReelMetadata(**reel_data)
-            reels_dict[reel.video_id] = reel
+        reels = _REEL_LIST_ADAPTER.validate_json(json_path.read_bytes())
+        reels_dict = {reel.video_id: reel for reel in reels}
 
-        logger.info(f"Loaded {len(reels_dict)} reel metadata entries")
+        logger.info("Loaded %d reel metadata entries", len(reels_dict))
         return reels_dict
 
     except Exception as e:
-        logger.error(f"Failed to load reel metadata: {e}")
+        logger.error("Failed to load reel metadata: %s", e)
         return {}
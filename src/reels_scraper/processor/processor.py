@@ -1,20 +1,57 @@
 """Content processor for generating markdown reports."""
 
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from tqdm import tqdm
 
 from ..logger import get_logger
 from ..models import MarkdownReport, ReelMetadata, Transcript
-from ..progress import ProgressTracker
+from ..progress import ProgressTracker, ProgressWriter
 from .ai_enhancer import AIEnhancer
 from .markdown_generator import MarkdownGenerator, load_reel_metadata_from_json
 
 logger = get_logger(__name__)
 
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for progress callbacks when resume is disabled."""
+
+
+class _LogProgress:
+    """Minimal stand-in for a tqdm bar that logs every few percent of progress."""
+
+    def __init__(self, total: int, desc: str, step_percent: int = 5):
+        """Initialize progress logger.
+
+        Args:
+            total: Total number of items
+            desc: Description used as the log message prefix
+            step_percent: Percentage of items between log lines
+        """
+        self.total = total
+        self.desc = desc
+        self.count = 0
+        self._step = max(1, total * step_percent // 100)
+        self._next_report = self._step
+
+    def update(self, n: int = 1) -> None:
+        """Advance the counter, logging when the next step is reached."""
+        self.count += n
+        if self.count >= self._next_report or self.count == self.total:
+            logger.info("%s: %d/%d", self.desc, self.count, self.total)
+            self._next_report = self.count + self._step
+
+    def set_postfix_str(self, s: str = "", refresh: bool = True) -> None:
+        """Ignore per-item status; only the counter is logged."""
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
 class ContentProcessor:
     """Process transcripts into enhanced markdown reports."""
 
@@ -29,6 +66,9 @@ class ContentProcessor:
         enable_resume: bool = True,
         progress_file: Optional[Path] = None,
         output_dir: Path = Path("./output/markdown"),
+        max_workers: int = 4,
+        rate_limit_qps: float = 2.0,
+        cache_dir: Optional[Path] = None,
     ):
         """Initialize content processor.
 
@@ -42,38 +82,52 @@ class ContentProcessor:
             enable_resume: Enable resume capability with progress tracking
             progress_file: Custom path for progress file
             output_dir: Output directory (for default progress file path)
+            max_workers: Number of transcripts processed concurrently
+            rate_limit_qps: Maximum AI requests per second (0 for unlimited)
+            cache_dir: Directory for cached AI responses (defaults to output_dir/.ai_cache)
         """
         self.ai_enhancer = AIEnhancer(
             api_key=google_api_key,
             model=ai_model,
             max_summary_length=max_summary_length,
+            cache_dir=cache_dir or (output_dir / ".ai_cache"),
+            requests_per_second=rate_limit_qps,
         )
-        self.markdown_generator = MarkdownGenerator(template=template)
+        self.markdown_generator = MarkdownGenerator(template_name=template)
         self.extract_topics = extract_topics
         self.generate_summary = generate_summary
         self.enable_resume = enable_resume
         self.progress_file = progress_file or (output_dir / ".processing_progress.json")
+        self.max_workers = max_workers
 
         logger.info(
-            f"Content processor initialized: {ai_model}, template={template}, "
-            f"summary={generate_summary}, topics={extract_topics}, resume={enable_resume}"
+            "Content processor initialized: %s, template=%s, summary=%s, topics=%s, "
+            "resume=%s, workers=%d",
+            ai_model,
+            template,
+            generate_summary,
+            extract_topics,
+            enable_resume,
+            max_workers,
         )
 
     def process_transcript(
         self,
         transcript: Transcript,
         reel: Optional[ReelMetadata] = None,
+        generated_at: Optional[str] = None,
     ) -> MarkdownReport:
         """Process single transcript into markdown report.
 
         Args:
             transcript: Transcript object
             reel: Optional reel metadata
+            generated_at: Generation timestamp for the report (defaults to now)
 
         Returns:
             MarkdownReport object
         """
-        logger.info(f"Processing transcript for video {transcript.video_id}")
+        logger.debug("Processing transcript for video %s", transcript.video_id)
 
         try:
             # Generate enhancements
@@ -96,13 +150,14 @@ class ContentProcessor:
                 key_points=key_points,
                 topics=topics,
                 reel=reel,
+                generated_at=generated_at,
             )
 
-            logger.info(f"Processed transcript: {report.title}")
+            logger.info("Processed transcript: %s", report.title)
             return report
 
         except Exception as e:
-            logger.error(f"Failed to process transcript {transcript.video_id}: {e}")
+            logger.error("Failed to process transcript %s: %s", transcript.video_id, e)
             raise
 
     def process_batch(
@@ -121,7 +176,7 @@ class ContentProcessor:
         Returns:
             List of MarkdownReport objects
         """
-        logger.info(f"Starting batch processing of {len(transcripts)} transcripts")
+        logger.info("Starting batch processing of %d transcripts", len(transcripts))
 
         reports = []
         failed_count = 0
@@ -148,73 +203,109 @@ class ContentProcessor:
             if len(transcripts_to_process) < len(transcripts):
                 already_done = len(transcripts) - len(transcripts_to_process)
                 logger.info(
-                    f"Resuming processing: {already_done} already completed, "
-                    f"{len(transcripts_to_process)} remaining"
+                    "Resuming processing: %d already completed, %d remaining",
+                    already_done,
+                    len(transcripts_to_process),
                 )
 
         # Create progress bar
         progress_bar = None
-        if show_progress:
+        if show_progress and sys.stderr.isatty():
+            # Redraw at most twice a second
             progress_bar = tqdm(
                 total=len(transcripts_to_process),
                 desc="Processing transcripts",
                 unit="transcript",
                 dynamic_ncols=True,
+                mininterval=0.5,
+                miniters=max(1, len(transcripts_to_process) // 200),
             )
+        elif show_progress:
+            # Logs and CI get periodic log lines instead of bar redraws
+            progress_bar = _LogProgress(len(transcripts_to_process), "Processing transcripts")
+
+        # Every report in the batch shares one generation timestamp
+        generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Look up reel metadata without re-checking for a missing index per item
+        get_reel = (reels_metadata or {}).get
+
+        # Tracker updates are applied and persisted in batches by a writer thread
+        writer = ProgressWriter(tracker, self.progress_file) if tracker else None
+        start_item = writer.start_item if writer else _noop
+        complete_item = writer.complete_item if writer else _noop
+        fail_item = writer.fail_item if writer else _noop
+
+        def process_one(transcript: Transcript) -> Optional[MarkdownReport]:
+            """Process one transcript, recording its outcome in the tracker."""
+            try:
+                # Mark as in progress
+                start_item(transcript.video_id)
+
+                reel = get_reel(transcript.video_id)
+                report = self.process_transcript(transcript, reel, generated_at)
+
+                # Mark as complete
+                complete_item(
+                    transcript.video_id,
+                    {"title": report.title, "topics": report.topics},
+                )
+
+                return report
+
+            except Exception as e:
+                logger.error("Failed to process transcript %s: %s", transcript.video_id, e)
+
+                # Mark as failed
+                fail_item(transcript.video_id, str(e))
+
+                return None
+
+        results: Dict[str, Optional[MarkdownReport]] = {}
+        workers = max(1, min(self.max_workers, len(transcripts_to_process)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="process")
 
         try:
-            # Process transcripts sequentially (Gemini API has rate limits)
-            for transcript in transcripts_to_process:
-                try:
-                    # Mark as in progress
-                    if tracker:
-                        tracker.start_item(transcript.video_id)
-                        tracker.save(self.progress_file)
-
-                    reel = None
-                    if reels_metadata:
-                        reel = reels_metadata.get(transcript.video_id)
-
-                    report = self.process_transcript(transcript, reel)
-                    reports.append(report)
-
-                    # Mark as complete
-                    if tracker:
-                        tracker.complete_item(
-                            transcript.video_id,
-                            {"title": report.title, "topics": report.topics},
-                        )
-                        tracker.save(self.progress_file)
-
-                    if progress_bar:
-                        progress_bar.set_postfix_str(f"✓ {transcript.video_id[:8]}")
-                        progress_bar.update(1)
-
-                except Exception as e:
+            # Gemini calls are I/O-bound; the throttle keeps them under the rate limit
+            futures = {
+                executor.submit(process_one, transcript): transcript
+                for transcript in transcripts_to_process
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                video_id = futures[future].video_id
+                report = future.result()
+                results[video_id] = report
+
+                if report is None:
                     failed_count += 1
-                    logger.error(f"Failed to process transcript {transcript.video_id}: {e}")
-
-                    # Mark as failed
-                    if tracker:
-                        tracker.fail_item(transcript.video_id, str(e))
-                        tracker.save(self.progress_file)
 
-                    if progress_bar:
-                        progress_bar.set_postfix_str(f"✗ {transcript.video_id[:8]}")
-                        progress_bar.update(1)
+                if progress_bar:
+                    # The postfix forces a redraw, so only refresh it every few items
+                    if done % 10 == 0 or report is None:
+                        mark = "✓" if report is not None else "✗"
+                        progress_bar.set_postfix_str(f"{mark} {video_id[:8]}", refresh=False)
+                    progress_bar.update(1)
 
         finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
             if progress_bar:
                 progress_bar.close()
 
-            # Mark stage as complete
-            if tracker:
-                tracker.complete()
-                tracker.save(self.progress_file)
-                logger.info(f"Progress saved to {self.progress_file}")
+            # Mark stage as complete and write the final snapshot
+            if writer:
+                writer.complete()
+                writer.close()
+                logger.info("Progress saved to %s", self.progress_file)
+
+        # Keep the input order regardless of completion order
+        for transcript in transcripts_to_process:
+            report = results.get(transcript.video_id)
+            if report is not None:
+                reports.append(report)
 
         logger.info(
-            f"Batch processing complete: {len(reports)} successful, {failed_count} failed"
+            "Batch processing complete: %d successful, %d failed", len(reports), failed_count
         )
 
         return reports
@@ -239,35 +330,46 @@ class ContentProcessor:
                 path = self.markdown_generator.save_report(report, output_dir)
                 saved_paths.append(path)
             except Exception as e:
-                logger.error(f"Failed to save report for {report.video_id}: {e}")
+                logger.error("Failed to save report for %s: %s", report.video_id, e)
 
-        logger.info(f"Saved {len(saved_paths)} markdown reports to {output_dir}")
+        logger.info("Saved %d markdown reports to %s", len(saved_paths), output_dir)
         return saved_paths
 
 
+def _load_transcript_file(json_file: Path) -> Optional[Transcript]:
+    """Load one transcript file.
+
+    Args:
+        json_file: Path to transcript JSON file
+
+    Returns:
+        Transcript object, or None if the file could not be loaded
+    """
+    try:
+        return Transcript.model_validate_json(json_file.read_bytes())
+    except Exception as e:
+        logger.error("Failed to load transcript from %s: %s", json_file, e)
+        return None
+
+
 def load_transcripts_from_directory(transcript_dir: Path) -> List[Transcript]:
     """Load all transcripts from directory.
 
+    Files are read concurrently so their I/O overlaps.
+
     Args:
         transcript_dir: Directory containing transcript JSON files
 
     Returns:
         List of Transcript objects
     """
-    import json
+    json_files = list(transcript_dir.glob("*.json"))
 
     transcripts = []
+    if json_files:
+        with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+            loaded = executor.map(_load_transcript_file, json_files)
+            transcripts = [transcript for transcript in loaded if transcript is not None]
 
-    for json_file in transcript_dir.glob("*.json"):
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            transcript = Transcript(**data)
-            transcripts.append(transcript)
-
-        except Exception as e:
-            logger.error(f"Failed to load transcript from {json_file}: {e}")
-
-    logger.info(f"Loaded {len(transcripts)} transcripts from {transcript_dir}")
+    logger.info("Loaded %d transcripts from %s", len(transcripts), transcript_dir)
     return transcripts
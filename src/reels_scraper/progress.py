@@ -1,12 +1,15 @@
 """Progress tracking and resume capability."""
 
-import json
+import os
+import queue
+import threading
+import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .logger import get_logger
 
@@ -44,53 +47,68 @@ class ProgressTracker(BaseModel):
     completed_at: Optional[datetime] = Field(default=None, description="When stage completed")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Stage metadata")
 
+    # Item IDs per status, in transition order. Dicts serve as ordered sets, so
+    # status queries never scan ``items``. Statuses must change through the
+    # tracker's methods to keep this index current.
+    _by_status: Dict[ProgressStatus, Dict[str, None]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the status index for loaded or constructed items."""
+        self._rebuild_status_index()
+
+    def _rebuild_status_index(self) -> None:
+        """Rebuild the status index from scratch with one scan of ``items``."""
+        # Private attributes resolve through BaseModel.__getattr__, so fill a local
+        by_status: Dict[ProgressStatus, Dict[str, None]] = {status: {} for status in ProgressStatus}
+        for item_id, item in self.items.items():
+            by_status[item.status][item_id] = None
+        self._by_status = by_status
+
+    def _set_status(self, item: ProgressItem, status: ProgressStatus) -> None:
+        """Change an item's status and move it to the matching index bucket.
+
+        Args:
+            item: Tracked item
+            status: New status
+        """
+        by_status = self._by_status
+        by_status[item.status].pop(item.item_id, None)
+        item.status = status
+        by_status[status][item.item_id] = None
+
     @property
     def pending_items(self) -> List[str]:
         """Get list of pending item IDs."""
-        return [
-            item_id
-            for item_id, item in self.items.items()
-            if item.status == ProgressStatus.PENDING
-        ]
+        return list(self._by_status[ProgressStatus.PENDING])
 
     @property
     def completed_items(self) -> List[str]:
         """Get list of completed item IDs."""
-        return [
-            item_id
-            for item_id, item in self.items.items()
-            if item.status == ProgressStatus.COMPLETED
-        ]
+        return list(self._by_status[ProgressStatus.COMPLETED])
 
     @property
     def failed_items(self) -> List[str]:
         """Get list of failed item IDs."""
-        return [
-            item_id
-            for item_id, item in self.items.items()
-            if item.status == ProgressStatus.FAILED
-        ]
+        return list(self._by_status[ProgressStatus.FAILED])
 
     @property
     def in_progress_items(self) -> List[str]:
         """Get list of in-progress item IDs."""
-        return [
-            item_id
-            for item_id, item in self.items.items()
-            if item.status == ProgressStatus.IN_PROGRESS
-        ]
+        return list(self._by_status[ProgressStatus.IN_PROGRESS])
 
     @property
     def completion_rate(self) -> float:
         """Get completion rate as percentage."""
         if self.total_items == 0:
             return 0.0
-        return (len(self.completed_items) / self.total_items) * 100
+        return (len(self._by_status[ProgressStatus.COMPLETED]) / self.total_items) * 100
 
     @property
     def is_complete(self) -> bool:
         """Check if all items are completed or failed."""
-        return len(self.pending_items) == 0 and len(self.in_progress_items) == 0
+        return not (
+            self._by_status[ProgressStatus.PENDING] or self._by_status[ProgressStatus.IN_PROGRESS]
+        )
 
     def add_item(self, item_id: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Add a new item to track.
@@ -104,6 +122,7 @@ class ProgressTracker(BaseModel):
                 item_id=item_id,
                 metadata=metadata or {},
             )
+            self._by_status[ProgressStatus.PENDING][item_id] = None
             self.total_items = len(self.items)
             logger.debug(f"Added item to progress: {item_id}")
 
@@ -114,7 +133,7 @@ class ProgressTracker(BaseModel):
             item_id: Item identifier
         """
         if item_id in self.items:
-            self.items[item_id].status = ProgressStatus.IN_PROGRESS
+            self._set_status(self.items[item_id], ProgressStatus.IN_PROGRESS)
             self.items[item_id].started_at = datetime.now()
             logger.debug(f"Started item: {item_id}")
 
@@ -128,7 +147,7 @@ class ProgressTracker(BaseModel):
             metadata: Optional metadata to merge
         """
         if item_id in self.items:
-            self.items[item_id].status = ProgressStatus.COMPLETED
+            self._set_status(self.items[item_id], ProgressStatus.COMPLETED)
             self.items[item_id].completed_at = datetime.now()
             if metadata:
                 self.items[item_id].metadata.update(metadata)
@@ -142,7 +161,7 @@ class ProgressTracker(BaseModel):
             error: Error message
         """
         if item_id in self.items:
-            self.items[item_id].status = ProgressStatus.FAILED
+            self._set_status(self.items[item_id], ProgressStatus.FAILED)
             self.items[item_id].completed_at = datetime.now()
             self.items[item_id].error = error
             logger.debug(f"Failed item: {item_id} - {error}")
@@ -155,7 +174,7 @@ class ProgressTracker(BaseModel):
             reason: Optional reason for skipping
         """
         if item_id in self.items:
-            self.items[item_id].status = ProgressStatus.SKIPPED
+            self._set_status(self.items[item_id], ProgressStatus.SKIPPED)
             self.items[item_id].completed_at = datetime.now()
             if reason:
                 self.items[item_id].metadata["skip_reason"] = reason
@@ -189,23 +208,111 @@ class ProgressTracker(BaseModel):
             self.completed_at = datetime.now()
             logger.info(f"Completed stage: {self.stage}")
 
-    def save(self, file_path: Path) -> None:
+    @staticmethod
+    def journal_path(file_path: Path) -> Path:
+        """Get the append-only event log that accompanies a progress snapshot.
+
+        Args:
+            file_path: Path to progress file
+
+        Returns:
+            Path to the JSONL event log
+        """
+        return file_path.with_suffix(".jsonl")
+
+    def append_events(self, file_path: Path, item_ids: Iterable[str]) -> None:
+        """Append the current state of several items to the event log in one write.
+
+        Each item becomes a single JSON line and the batch goes out in one
+        ``O_APPEND`` write, so recording updates costs O(updated items)
+        regardless of how many items are tracked. Events are replayed over the
+        snapshot by :meth:`load` and discarded by the next :meth:`save`.
+
+        Args:
+            file_path: Path to progress file
+            item_ids: Item identifiers
+        """
+        lines = [
+            self.items[item_id].model_dump_json().encode("utf-8") + b"\n"
+            for item_id in item_ids
+            if item_id in self.items
+        ]
+        if not lines:
+            return
+
+        try:
+            line = b"".join(lines)
+            fd = os.open(
+                self.journal_path(file_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+        except Exception as e:
+            logger.error(f"Failed to append progress event: {e}")
+
+    def save(self, file_path: Path, fsync: bool = False) -> None:
         """Save progress to JSON file.
 
+        The snapshot is written to a temporary sibling and renamed over the
+        old one, so a crash mid-save leaves the previous snapshot intact.
+        Writing a full snapshot supersedes the event log, which is removed.
+
         Args:
             file_path: Path to save progress file
+            fsync: Flush the snapshot to stable storage before returning
         """
         try:
             file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+
+            # Compact (unindented) JSON: resume parses it and nobody edits it by hand
+            with open(tmp_path, "wb") as f:
+                f.write(self.model_dump_json().encode("utf-8"))
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(self.model_dump(), f, indent=2, default=str)
+            self.journal_path(file_path).unlink(missing_ok=True)
 
             logger.debug(f"Saved progress to {file_path}")
 
         except Exception as e:
             logger.error(f"Failed to save progress: {e}")
 
+    def _replay_journal(self, file_path: Path) -> None:
+        """Apply events from the event log on top of the loaded snapshot.
+
+        Args:
+            file_path: Path to progress file
+        """
+        journal = self.journal_path(file_path)
+        if not journal.exists():
+            return
+
+        replayed = 0
+        by_status = self._by_status
+        with open(journal, "rb") as f:
+            for line in f:
+                try:
+                    item = ProgressItem.model_validate_json(line)
+                except Exception:
+                    # A crash can leave a partially written last line
+                    logger.debug(f"Ignoring malformed progress event in {journal}")
+                    continue
+                previous = self.items.get(item.item_id)
+                if previous is not None:
+                    by_status[previous.status].pop(item.item_id, None)
+                self.items[item.item_id] = item
+                by_status[item.status][item.item_id] = None
+                replayed += 1
+
+        self.total_items = len(self.items)
+        logger.debug(f"Replayed {replayed} progress events from {journal}")
+
     @classmethod
     def load(cls, file_path: Path) -> Optional["ProgressTracker"]:
         """Load progress from JSON file.
@@ -221,10 +328,8 @@ class ProgressTracker(BaseModel):
                 logger.debug(f"Progress file not found: {file_path}")
                 return None
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            tracker = cls(**data)
+            tracker = cls.model_validate_json(file_path.read_bytes())
+            tracker._replay_journal(file_path)
             logger.info(
                 f"Loaded progress for stage '{tracker.stage}': "
                 f"{len(tracker.completed_items)}/{tracker.total_items} completed"
@@ -256,7 +361,7 @@ class ProgressTracker(BaseModel):
         if tracker:
             # Reset in-progress items to pending (in case of crash)
             for item_id in tracker.in_progress_items:
-                tracker.items[item_id].status = ProgressStatus.PENDING
+                tracker._set_status(tracker.items[item_id], ProgressStatus.PENDING)
                 logger.debug(f"Reset in-progress item to pending: {item_id}")
 
             return tracker
@@ -291,3 +396,116 @@ class ProgressTracker(BaseModel):
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
+
+
+# Sentinel that tells the writer thread to drain and exit
+_STOP = object()
+
+
+class ProgressWriter:
+    """Apply tracker updates and persist them from a dedicated writer thread.
+
+    Callers only enqueue events, so the hot path never waits on tracker
+    mutations or disk I/O. The writer appends updated items to the event log
+    at most once per ``flush_interval`` and writes a full snapshot every
+    ``snapshot_interval`` updated items, or every tenth of the tracked items
+    if that is more, so snapshots cost amortized O(1) per update however large
+    the tracker grows. :meth:`close` drains the queue and writes a final
+    fsynced snapshot.
+    """
+
+    def __init__(
+        self,
+        tracker: ProgressTracker,
+        file_path: Path,
+        flush_interval: float = 0.5,
+        snapshot_interval: int = 100,
+    ) -> None:
+        """Initialize and start the writer thread.
+
+        Args:
+            tracker: Tracker owned by the writer until :meth:`close` returns
+            file_path: Path to progress file
+            flush_interval: Seconds to coalesce updates before writing them
+            snapshot_interval: Minimum updated items between full snapshots
+        """
+        self.tracker = tracker
+        self.file_path = file_path
+        self.flush_interval = flush_interval
+        self.snapshot_interval = snapshot_interval
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+
+    def start_item(self, item_id: str) -> None:
+        """Queue marking an item as in progress."""
+        self._queue.put(("start_item", item_id, ()))
+
+    def complete_item(self, item_id: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Queue marking an item as completed."""
+        self._queue.put(("complete_item", item_id, (metadata,)))
+
+    def fail_item(self, item_id: str, error: str) -> None:
+        """Queue marking an item as failed."""
+        self._queue.put(("fail_item", item_id, (error,)))
+
+    def skip_item(self, item_id: str, reason: Optional[str] = None) -> None:
+        """Queue marking an item as skipped."""
+        self._queue.put(("skip_item", item_id, (reason,)))
+
+    def complete(self) -> None:
+        """Queue marking the stage as completed."""
+        self._queue.put(("complete", None, ()))
+
+    def close(self) -> None:
+        """Drain queued updates, write a final snapshot and stop the thread."""
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _apply(self, event: Tuple[str, Optional[str], Tuple[Any, ...]]) -> None:
+        """Apply one queued event to the tracker."""
+        method, item_id, args = event
+        try:
+            if item_id is None:
+                getattr(self.tracker, method)(*args)
+            else:
+                getattr(self.tracker, method)(item_id, *args)
+        except Exception as e:
+            logger.error(f"Failed to apply progress event {method} for {item_id}: {e}")
+
+    def _run(self) -> None:
+        """Consume events, coalescing writes on the flush interval."""
+        dirty: Set[str] = set()
+        deadline: Optional[float] = None
+        since_snapshot = 0
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                event = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                event = None
+
+            if event is _STOP:
+                break
+
+            if event is not None:
+                self._apply(event)
+                if event[1] is not None:
+                    dirty.add(event[1])
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+                if deadline is None or time.monotonic() < deadline:
+                    continue
+
+            since_snapshot += len(dirty)
+            if since_snapshot >= max(self.snapshot_interval, len(self.tracker.items) // 10):
+                self.tracker.save(self.file_path)
+                since_snapshot = 0
+            else:
+                self.tracker.append_events(self.file_path, dirty)
+            dirty = set()
+            deadline = None
+
+        self.tracker.save(self.file_path, fsync=True)
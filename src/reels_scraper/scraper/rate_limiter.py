@@ -1,8 +1,8 @@
 """Rate limiter for Instagram API requests."""
 
 import time
-from datetime import datetime, timedelta
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 
 from ..logger import get_logger
 
@@ -21,8 +21,9 @@ class RateLimiter:
         """
         self.delay = delay
         self.max_requests_per_minute = max_requests_per_minute
-        self.last_request_time: Optional[datetime] = None
-        self.request_times: list[datetime] = []
+        # time.monotonic() readings, immune to wall-clock adjustments
+        self.last_request_time: Optional[float] = None
+        self.request_times: Deque[float] = deque()
 
         logger.debug(
             f"Rate limiter initialized: {delay}s delay, "
@@ -31,33 +32,33 @@ class RateLimiter:
 
     def wait_if_needed(self) -> None:
         """Wait if necessary to comply with rate limits."""
-        current_time = datetime.now()
+        current_time = time.monotonic()
 
-        # Remove request times older than 1 minute
-        cutoff_time = current_time - timedelta(minutes=1)
-        self.request_times = [t for t in self.request_times if t > cutoff_time]
+        # Remove request times older than 1 minute; they expire oldest first
+        cutoff_time = current_time - 60.0
+        while self.request_times and self.request_times[0] <= cutoff_time:
+            self.request_times.popleft()
 
         # Check if we've exceeded requests per minute
         if len(self.request_times) >= self.max_requests_per_minute:
             # Wait until the oldest request is more than 1 minute old
-            wait_until = self.request_times[0] + timedelta(minutes=1)
-            wait_seconds = (wait_until - current_time).total_seconds()
+            wait_seconds = self.request_times[0] + 60.0 - current_time
 
             if wait_seconds > 0:
                 logger.warning(
                     f"Rate limit approaching, waiting {wait_seconds:.1f}s before next request"
                 )
                 time.sleep(wait_seconds)
-                current_time = datetime.now()
+                current_time = time.monotonic()
 
         # Check minimum delay between requests
-        if self.last_request_time:
-            elapsed = (current_time - self.last_request_time).total_seconds()
+        if self.last_request_time is not None:
+            elapsed = current_time - self.last_request_time
             if elapsed < self.delay:
                 wait_time = self.delay - elapsed
                 logger.debug(f"Waiting {wait_time:.2f}s before next request")
                 time.sleep(wait_time)
-                current_time = datetime.now()
+                current_time = time.monotonic()
 
         # Record this request
         self.last_request_time = current_time
@@ -75,5 +76,5 @@ class RateLimiter:
     def reset(self) -> None:
         """Reset rate limiter state."""
         self.last_request_time = None
-        self.request_times = []
+        self.request_times.clear()
         logger.debug("Rate limiter reset")
@@ -1,6 +1,5 @@
 """Instagram Reels scraper."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -10,6 +9,7 @@ from instaloader import Profile
 
 from ..logger import get_logger
 from ..models import ProfileMetadata, ReelMetadata
+from ..serialization import dumps_json
 from .rate_limiter import RateLimiter
 from .session_manager import SessionManager
 
@@ -19,6 +19,12 @@ logger = get_logger(__name__)
 class InstagramScraper:
     """Scraper for Instagram profiles and Reels."""
 
+    # Reels found so far, one JSON object per line, while fetch_reels runs
+    CHECKPOINT_FILE = "reels_list.ndjson"
+
+    # Posts returned per page by Profile.get_posts()
+    POSTS_PER_PAGE = 12
+
     def __init__(
         self,
         username: str,
@@ -133,15 +139,55 @@ class InstagramScraper:
             logger.error(f"Failed to fetch profile info: {e}")
             raise
 
-    def fetch_reels(self, limit: Optional[int] = None) -> List[ReelMetadata]:
+    def _load_checkpoint(self, checkpoint_file: Path) -> List[ReelMetadata]:
+        """Load Reels checkpointed by an interrupted :meth:`fetch_reels` run.
+
+        A partially written last line is cut off so new Reels can be appended.
+
+        Args:
+            checkpoint_file: Path to the NDJSON checkpoint
+
+        Returns:
+            List of ReelMetadata instances found so far
+        """
+        if not checkpoint_file.exists():
+            return []
+
+        data = checkpoint_file.read_bytes()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            with open(checkpoint_file, "r+b") as f:
+                f.truncate(complete)
+
+        reels: List[ReelMetadata] = []
+        for line in data[:complete].splitlines():
+            try:
+                reels.append(ReelMetadata.model_validate_json(line))
+            except ValueError as e:
+                logger.warning(f"Skipping invalid checkpoint line in {checkpoint_file}: {e}")
+
+        return reels
+
+    def fetch_reels(
+        self, limit: Optional[int] = None, output_dir: Optional[Path] = None
+    ) -> List[ReelMetadata]:
         """Fetch all Reels from the target profile.
 
+        When ``output_dir`` is given, each Reel is also appended to
+        ``reels_list.ndjson`` as soon as it is found. A run interrupted by a
+        crash or rate-limit ban resumes from that file: Reels already in it are
+        kept and their posts are not fetched again. :meth:`save_metadata`
+        removes the file once ``reels_list.json`` exists.
+
         Args:
-            limit: Maximum number of Reels to fetch (None for all)
+            limit: Maximum number of Reels to fetch, including checkpointed ones
+                (None for all)
+            output_dir: Optional directory to checkpoint Reels into
 
         Returns:
             List of ReelMetadata instances
         """
+        checkpoint = None
         try:
             if not self.profile:
                 logger.info("Profile not loaded, fetching profile info first")
@@ -153,36 +199,61 @@ class InstagramScraper:
             )
 
             reels: List[ReelMetadata] = []
+            if output_dir is not None:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                checkpoint_file = output_dir / self.CHECKPOINT_FILE
+                reels = self._load_checkpoint(checkpoint_file)
+                if reels:
+                    logger.info(f"Resuming from {len(reels)} checkpointed Reels")
+                checkpoint = open(checkpoint_file, "ab")
+
+            known = {reel.shortcode for reel in reels}
             processed_count = 0
-            reel_count = 0
+            reel_count = len(reels)
+
+            if limit and reel_count >= limit:
+                logger.info(f"Reached limit of {limit} Reels")
+                return reels[:limit]
 
             # Iterate through all posts
             for post in self.profile.get_posts():
-                with self.rate_limiter:
-                    processed_count += 1
+                processed_count += 1
+
+                # Reels from an interrupted run are already in the checkpoint
+                resumed = post.shortcode in known
+
+                # Posts arrive a page at a time, so most need no request of their own.
+                # Videos may fetch their full metadata for video_url/video_duration.
+                if (post.is_video and not resumed) or processed_count % self.POSTS_PER_PAGE == 0:
+                    self.rate_limiter.wait_if_needed()
 
-                    # Extract metadata if it's a video/Reel
-                    reel_metadata = self._extract_reel_metadata(post)
+                if resumed:
+                    continue
 
-                    if reel_metadata:
-                        reels.append(reel_metadata)
-                        reel_count += 1
+                # Extract metadata if it's a video/Reel
+                reel_metadata = self._extract_reel_metadata(post)
 
-                        logger.debug(
-                            f"Found Reel {reel_count}: {reel_metadata.shortcode} "
-                            f"({reel_metadata.duration:.1f}s, {reel_metadata.view_count} views)"
-                        )
+                if reel_metadata:
+                    reels.append(reel_metadata)
+                    reel_count += 1
+                    if checkpoint:
+                        checkpoint.write(reel_metadata.model_dump_json().encode() + b"\n")
 
-                        # Check limit
-                        if limit and reel_count >= limit:
-                            logger.info(f"Reached limit of {limit} Reels")
-                            break
+                    logger.debug(
+                        f"Found Reel {reel_count}: {reel_metadata.shortcode} "
+                        f"({reel_metadata.duration:.1f}s, {reel_metadata.view_count} views)"
+                    )
 
-                    # Log progress every 10 posts
-                    if processed_count % 10 == 0:
-                        logger.info(
-                            f"Processed {processed_count} posts, found {reel_count} Reels"
-                        )
+                    # Check limit
+                    if limit and reel_count >= limit:
+                        logger.info(f"Reached limit of {limit} Reels")
+                        break
+
+                # Log progress and flush the checkpoint every 10 posts
+                if processed_count % 10 == 0:
+                    if checkpoint:
+                        checkpoint.flush()
+                    logger.info(f"Processed {processed_count} posts, found {reel_count} Reels")
 
             logger.info(
                 f"Scraping complete: Found {reel_count} Reels out of {processed_count} posts"
@@ -194,6 +265,10 @@ class InstagramScraper:
             logger.error(f"Failed to fetch Reels: {e}")
             raise
 
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
     def save_metadata(
         self,
         profile_metadata: ProfileMetadata,
@@ -212,17 +287,18 @@ class InstagramScraper:
 
             # Save profile metadata
             profile_file = output_dir / "profile_metadata.json"
-            with open(profile_file, "w", encoding="utf-8") as f:
-                json.dump(profile_metadata.model_dump(), f, indent=2, default=str)
+            profile_file.write_text(profile_metadata.model_dump_json(indent=2), encoding="utf-8")
             logger.info(f"Saved profile metadata to {profile_file}")
 
             # Save Reels list
             reels_file = output_dir / "reels_list.json"
-            reels_data = [reel.model_dump() for reel in reels]
-            with open(reels_file, "w", encoding="utf-8") as f:
-                json.dump(reels_data, f, indent=2, default=str)
+            reels_data = [reel.model_dump(mode="json") for reel in reels]
+            reels_file.write_bytes(dumps_json(reels_data))
             logger.info(f"Saved {len(reels)} Reels metadata to {reels_file}")
 
+            # The consolidated list supersedes the fetch checkpoint
+            (output_dir / self.CHECKPOINT_FILE).unlink(missing_ok=True)
+
             # Save summary
             summary_file = output_dir / "scraping_summary.json"
             summary = {
@@ -232,8 +308,7 @@ class InstagramScraper:
                 "reels_file": str(reels_file),
                 "profile_file": str(profile_file),
             }
-            with open(summary_file, "w", encoding="utf-8") as f:
-                json.dump(summary, f, indent=2)
+            summary_file.write_bytes(dumps_json(summary))
             logger.info(f"Saved scraping summary to {summary_file}")
 
         except Exception as e:
@@ -258,7 +333,7 @@ class InstagramScraper:
         profile_metadata = self.get_profile_info()
 
         # Fetch Reels
-        reels = self.fetch_reels(limit=limit)
+        reels = self.fetch_reels(limit=limit, output_dir=output_dir)
 
         # Save metadata
         self.save_metadata(profile_metadata, reels, output_dir)
@@ -0,0 +1,49 @@
+"""JSON serialization helpers with an optional orjson fast path."""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(
+    obj: Any, indent: bool = True, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Uses orjson when installed and falls back to the standard library otherwise.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+        default: Optional fallback for objects that are not natively serializable
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
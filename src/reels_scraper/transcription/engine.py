@@ -1,6 +1,5 @@
 """Transcription engine for processing videos."""
 
-import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
@@ -10,7 +9,7 @@ from tqdm import tqdm
 
 from ..logger import get_logger
 from ..models import Transcript
-from ..progress import ProgressTracker
+from ..progress import ProgressTracker, ProgressWriter
 from .audio_extractor import AudioExtractor
 from .whisper_service import WhisperService
 
@@ -163,6 +162,9 @@ class TranscriptionEngine:
                 dynamic_ncols=True,
             )
 
+        # Tracker updates go to the event log in batches instead of full rewrites
+        writer = ProgressWriter(tracker, self.progress_file) if tracker else None
+
         try:
             # Process videos concurrently
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -183,23 +185,21 @@ class TranscriptionEngine:
 
                     try:
                         # Mark as in progress
-                        if tracker:
-                            tracker.start_item(video_id)
-                            tracker.save(self.progress_file)
+                        if writer:
+                            writer.start_item(video_id)
 
                         transcript = future.result()
                         transcripts.append(transcript)
 
                         # Mark as complete
-                        if tracker:
-                            tracker.complete_item(
+                        if writer:
+                            writer.complete_item(
                                 video_id,
                                 {
                                     "language": transcript.language,
                                     "word_count": transcript.word_count,
                                 },
                             )
-                            tracker.save(self.progress_file)
 
                         if progress_bar:
                             progress_bar.set_postfix_str(
@@ -212,9 +212,8 @@ class TranscriptionEngine:
                         logger.error(f"Transcription failed for {video_path}: {e}")
 
                         # Mark as failed
-                        if tracker:
-                            tracker.fail_item(video_id, str(e))
-                            tracker.save(self.progress_file)
+                        if writer:
+                            writer.fail_item(video_id, str(e))
 
                         if progress_bar:
                             progress_bar.set_postfix_str(f"✗ {video_path.name}")
@@ -224,10 +223,10 @@ class TranscriptionEngine:
             if progress_bar:
                 progress_bar.close()
 
-            # Mark stage as complete
-            if tracker:
-                tracker.complete()
-                tracker.save(self.progress_file)
+            # Mark stage as complete and write the final snapshot
+            if writer:
+                writer.complete()
+                writer.close()
                 logger.info(f"Progress saved to {self.progress_file}")
 
         logger.info(
@@ -252,8 +251,7 @@ class TranscriptionEngine:
             output_path = output_dir / f"{transcript.video_id}.json"
 
             try:
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(transcript.model_dump(), f, indent=2, default=str)
+                output_path.write_text(transcript.model_dump_json(indent=2), encoding="utf-8")
 
                 logger.debug(f"Saved transcript: {output_path}")
 
@@ -272,10 +270,7 @@ class TranscriptionEngine:
             Transcript object
         """
         try:
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            return Transcript(**data)
+            return Transcript.model_validate_json(transcript_path.read_bytes())
 
         except Exception as e:
             logger.error(f"Failed to load transcript from {transcript_path}: {e}")
@@ -0,0 +1,95 @@
+"""Tests for AI enhancement helpers."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from reels_scraper.processor.ai_enhancer import AIEnhancer, _clean_key_points, _clean_topics
+
+
+def test_clean_topics_skips_hash_only_lines() -> None:
+    """Lines made only of '#' do not become topics or use up the limit."""
+    text = "#\n##\n# \n#Tech\n# Machine Learning\n"
+    assert _clean_topics(text, 5) == ["tech", "machine_learning"]
+    assert _clean_topics("#\n##\n#a\n#b\n#c\n", 2) == ["a", "b"]
+
+
+def test_clean_key_points_strips_markers() -> None:
+    """Bullet markers, blank lines and marker-only lines are dropped."""
+    text = "- First point\n\n* Second point  \n-\n• Third\n"
+    assert _clean_key_points(text, 5) == ["First point", "Second point", "Third"]
+
+
+class _Blocked:
+    """Response whose text accessor fails, like a safety-filtered reply."""
+
+    @property
+    def text(self) -> str:
+        raise ValueError("response was blocked")
+
+
+class _Reply:
+    """Response with plain text."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeModel:
+    """Async model stand-in: invalid combined JSON, blocked summary."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate_content_async(self, prompt: str, **kwargs: Any) -> Any:
+        self.calls += 1
+        if "generation_config" in kwargs:
+            return _Reply("not json")
+        if prompt.startswith("Please provide a concise executive summary"):
+            return _Blocked()
+        if prompt.startswith("Extract the"):
+            return _Reply("- First\n- Second")
+        return _Reply("#Tech\n#AI")
+
+
+def test_enhance_content_async_falls_back_per_request(tmp_path: Path) -> None:
+    """A blocked fallback reply only loses its own field; the rest is cached."""
+    enhancer = AIEnhancer(api_key="test-key", cache_dir=tmp_path)
+    model = _FakeModel()
+    enhancer.model = model
+
+    result = asyncio.run(enhancer.enhance_content_async("some transcript", "en"))
+
+    assert result == {
+        "summary": "Summary generation failed",
+        "key_points": ["First", "Second"],
+        "topics": ["tech", "ai"],
+    }
+    assert model.calls == 4
+    # Key points and topics are on disk; the failed summary is not
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    # A fresh enhancer reuses the cached parts and only retries the summary
+    enhancer = AIEnhancer(api_key="test-key", cache_dir=tmp_path)
+    model = _FakeModel()
+    enhancer.model = model
+    again = asyncio.run(enhancer.enhance_content_async("some transcript", "en"))
+    assert again == result
+    assert model.calls == 2
+
+
+def test_cached_responses_are_copies() -> None:
+    """Mutating a returned response does not change what the cache returns next."""
+    enhancer = AIEnhancer(api_key="test-key")
+    model = _FakeModel()
+    enhancer.model = model
+
+    first = asyncio.run(enhancer.enhance_content_async("some transcript", "en"))
+    first["topics"].append("mutated")
+    first["summary"] = "mutated"
+
+    again = asyncio.run(enhancer.enhance_content_async("some transcript", "en"))
+    assert again["topics"] == ["tech", "ai"]
+    assert again["summary"] == "Summary generation failed"
+    # Only the combined request and the failed summary are retried
+    assert model.calls == 6
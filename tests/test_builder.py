@@ -0,0 +1,104 @@
+"""Tests for the knowledge base builder."""
+
+from pathlib import Path
+
+from reels_scraper.builder import KnowledgeBaseBuilder
+from reels_scraper.builder.builder import _METADATA_CACHE_VERSION
+from reels_scraper.serialization import dumps_json, loads_json
+
+REPORT = """# Good Reel
+
+**Profile**: @someone
+**URL**: [Watch](https://www.instagram.com/p/abc/)
+
+Body text.
+
+## Topics
+
+#tech #ai
+
+**Word Count**: 42
+**Language**: en
+"""
+
+
+def test_build_survives_undecodable_markdown(tmp_path: Path) -> None:
+    """A non-UTF-8 report falls back to defaults instead of aborting the build."""
+    markdown_dir = tmp_path / "md"
+    markdown_dir.mkdir()
+    (markdown_dir / "good.md").write_text(REPORT, encoding="utf-8")
+    (markdown_dir / "broken.md").write_bytes(b"# Caf\xe9\n\n**Word Count**: 3\n")
+
+    output_dir = tmp_path / "kb"
+    builder = KnowledgeBaseBuilder(markdown_dir, output_dir, create_index=True)
+    builder.build()
+
+    broken = builder.metadata_map[markdown_dir / "broken.md"]
+    assert broken["title"] == "broken"
+    assert broken["word_count"] == 0
+    assert broken["topics"] == []
+
+    assert builder._total_words == 42
+    assert builder._profiles == {"someone"}
+    assert (output_dir / "index.md").exists()
+    assert sorted(builder.topics_map) == ["ai", "tech", "uncategorized"]
+
+
+def test_flat_build_into_source_directory_keeps_files(tmp_path: Path) -> None:
+    """Building a flat knowledge base into its own source directory loses nothing."""
+    markdown_dir = tmp_path / "md"
+    markdown_dir.mkdir()
+    (markdown_dir / "a.md").write_text(REPORT, encoding="utf-8")
+
+    builder = KnowledgeBaseBuilder(
+        markdown_dir, markdown_dir, organize_by_topic=False, create_index=False
+    )
+    builder.build()
+    builder.build()
+
+    assert (markdown_dir / "a.md").read_text(encoding="utf-8") == REPORT
+
+
+def test_metadata_cache_is_rewritten_only_when_stale(tmp_path: Path) -> None:
+    """Unchanged rebuilds leave the cache alone; other cache versions are ignored."""
+    markdown_dir = tmp_path / "md"
+    markdown_dir.mkdir()
+    (markdown_dir / "a.md").write_text(REPORT, encoding="utf-8")
+    output_dir = tmp_path / "kb"
+    cache_file = output_dir / ".metadata-cache.json"
+
+    KnowledgeBaseBuilder(markdown_dir, output_dir, create_index=False).scan_markdown_files()
+    written = cache_file.stat().st_mtime_ns
+    assert loads_json(cache_file.read_bytes())["version"] == _METADATA_CACHE_VERSION
+
+    KnowledgeBaseBuilder(markdown_dir, output_dir, create_index=False).scan_markdown_files()
+    assert cache_file.stat().st_mtime_ns == written
+
+    cache = loads_json(cache_file.read_bytes())
+    cache["version"] = _METADATA_CACHE_VERSION + 1
+    cache["files"]["a.md"]["metadata"]["word_count"] = 7
+    cache_file.write_bytes(dumps_json(cache))
+
+    builder = KnowledgeBaseBuilder(markdown_dir, output_dir, create_index=False)
+    builder.scan_markdown_files()
+    assert builder._total_words == 42
+    assert loads_json(cache_file.read_bytes())["version"] == _METADATA_CACHE_VERSION
+
+
+def test_large_report_with_topics_mid_file(tmp_path: Path) -> None:
+    """Topics outside the head and tail excerpts of a large report are still found."""
+    markdown_dir = tmp_path / "md"
+    markdown_dir.mkdir()
+    padding = "é" * 9000 + "\n"
+    (markdown_dir / "long.md").write_text(
+        "# Long Reel\n\n" + padding + "## Topics\n\n#tech\n\n" + padding + "**Word Count**: 5\n",
+        encoding="utf-8",
+    )
+
+    builder = KnowledgeBaseBuilder(markdown_dir, tmp_path / "kb", create_index=False)
+    builder.scan_markdown_files()
+
+    metadata = builder.metadata_map[markdown_dir / "long.md"]
+    assert "error" not in metadata
+    assert metadata["topics"] == ["tech"]
+    assert metadata["word_count"] == 5
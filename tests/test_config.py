@@ -0,0 +1,42 @@
+"""Tests for configuration loading."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from reels_scraper.config import Config
+
+
+def test_load_from_yaml_applies_environment_on_every_load(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reloading an unchanged file still picks up environment changes."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("download:\n  max_workers: 8\n", encoding="utf-8")
+
+    monkeypatch.setenv("OPENAI_API_KEY", "first-key")
+    first = Config.load_from_yaml(config_file)
+
+    monkeypatch.setenv("OPENAI_API_KEY", "second-key")
+    second = Config.load_from_yaml(config_file)
+
+    assert first.openai_api_key == "first-key"
+    assert second.openai_api_key == "second-key"
+    assert first.download.max_workers == second.download.max_workers == 8
+
+    # Loaded configs are independent of each other
+    second.download.max_workers = 2
+    assert Config.load_from_yaml(config_file).download.max_workers == 8
+
+
+def test_load_from_yaml_rereads_file_of_new_size(tmp_path: Path) -> None:
+    """A rewrite that keeps the mtime but changes the size is not served from cache."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("download:\n  max_workers: 8\n", encoding="utf-8")
+    mtime_ns = config_file.stat().st_mtime_ns
+    assert Config.load_from_yaml(config_file).download.max_workers == 8
+
+    config_file.write_text("download:\n  max_workers: 12\n  retry_count: 2\n", encoding="utf-8")
+    os.utime(config_file, ns=(mtime_ns, mtime_ns))
+    assert Config.load_from_yaml(config_file).download.max_workers == 12
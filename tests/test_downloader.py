@@ -0,0 +1,40 @@
+"""Tests for the video downloader."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from reels_scraper.downloader.downloader import _PERMANENT_ERROR_PATTERN, VideoDownloader
+from reels_scraper.serialization import dumps_json
+
+
+@pytest.mark.parametrize(
+    ("message", "permanent"),
+    [
+        ("ERROR: HTTP Error 404: Not Found", True),
+        ("ERROR: HTTP Error 410: Gone", True),
+        ("ERROR: This video has been removed", True),
+        ("ERROR: Requested format is not available", False),
+        ("ERROR: This video is not available in your country", False),
+        ("ERROR: Impersonate target is not available", False),
+        ("ERROR: Instagram sent an empty media response; the account may be private", False),
+    ],
+)
+def test_only_gone_reels_are_permanent_errors(message: str, permanent: bool) -> None:
+    """Errors that may succeed later with other options are retried on the next run."""
+    assert bool(_PERMANENT_ERROR_PATTERN.search(message)) is permanent
+
+
+def test_negative_cache_entries_expire(tmp_path: Path) -> None:
+    """Reels are skipped only while their negative cache entry is younger than the TTL."""
+    now = time.time()
+    cache_file = tmp_path / ".download_negative_cache.json"
+    cache_file.write_bytes(dumps_json({"video_ids": {"fresh": now, "stale": now - 3600}}))
+
+    downloader = VideoDownloader(output_dir=tmp_path, negative_cache_ttl=60)
+    assert downloader._is_negatively_cached("fresh")
+    assert not downloader._is_negatively_cached("stale")
+
+    disabled = VideoDownloader(output_dir=tmp_path, negative_cache_ttl=0)
+    assert not disabled._is_negatively_cached("fresh")
@@ -0,0 +1,33 @@
+"""Tests for logging configuration."""
+
+import logging
+import logging.handlers
+import queue
+import time
+from pathlib import Path
+
+from reels_scraper.logger import CachedRotatingFileHandler, FlushingQueueListener
+
+
+def test_listener_flushes_buffered_records(tmp_path: Path) -> None:
+    """Buffered records reach the file once the listener's flush interval passes."""
+    log_file = tmp_path / "app.log"
+    handler = CachedRotatingFileHandler(log_file, maxBytes=1024 * 1024, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+    listener = FlushingQueueListener(log_queue, handler, flush_interval=0.05)
+    listener.start()
+    try:
+        logging.handlers.QueueHandler(log_queue).handle(
+            logging.LogRecord("test", logging.INFO, __file__, 1, "héllo", None, None)
+        )
+
+        deadline = time.monotonic() + 5
+        while log_file.stat().st_size == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        listener.stop()
+        handler.close()
+
+    assert log_file.read_bytes() == "héllo\n".encode("utf-8")
+    assert handler._bytes_written == log_file.stat().st_size